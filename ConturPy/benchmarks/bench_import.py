@@ -0,0 +1,62 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+import numpy as np
+
+# modules only plotting and reporting need, none of them may be loaded by the parsing path
+HEAVY_MODULES = ["matplotlib", "matplotlib.pyplot", "scipy", "scipy.interpolate", "pandas"]
+
+# what a parse-only worker imports; numpy is imported first and timed separately, it is needed either way
+TARGETS = {
+    "conturpy": "import conturpy",
+    "read_output": "from conturpy.read_output import ConturResult",
+}
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import numpy
+numpy_time = time.perf_counter() - start
+start = time.perf_counter()
+{statement}
+print(json.dumps({{"numpy": numpy_time, "package": time.perf_counter() - start,
+                  "heavy": [name for name in {heavy!r} if name in sys.modules]}}))
+"""
+
+
+def measure(statement, repeat=5):
+    # every sample is a fresh interpreter, modules already imported in this one would hide the cost
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([root, os.environ.get("PYTHONPATH", "")]).rstrip(os.pathsep))
+    probe = _PROBE.format(statement=statement, heavy=HEAVY_MODULES)
+    samples = [json.loads(subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True,
+                                         env=env).stdout) for _ in range(repeat)]
+    return {"numpy": float(np.median([x["numpy"] for x in samples])),
+            "package": float(np.median([x["package"] for x in samples])),
+            "heavy": sorted({name for x in samples for name in x["heavy"]})}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_import",
+                                     description="Check the time a parse-only process spends importing conturpy")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget", type=float, default=0.15,
+                        help="seconds conturpy may add on top of importing numpy, exit with status 1 above it")
+    args = parser.parse_args(argv)
+
+    status = 0
+    for name, statement in TARGETS.items():
+        timings = measure(statement, repeat=args.repeat)
+        print(f"{name:>12s} {timings['package'] * 1e3:10.1f} ms (numpy {timings['numpy'] * 1e3:.1f} ms)" +
+              (" loads " + ", ".join(timings["heavy"]) if timings["heavy"] else ""))
+        if timings["heavy"] or timings["package"] > args.budget:
+            status = 1
+    if status:
+        print(f"over the import budget of {args.budget * 1e3:g} ms or loading plotting modules")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,137 @@
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import warnings
+import numpy as np
+from conturpy.read_output import ConturResult, ConturTable, get_params, get_project_slices, get_project_title, \
+    identify_tables
+from .synthetic import synthetic_output
+
+_DEFAULT_RESULTS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results.jsonl")
+
+
+def _best_time(fun, repeat):
+    # the minimum is the run least disturbed by the rest of the machine
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fun()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def bench_text(text, repeat=5):
+    lines = text.splitlines(keepends=True)
+    title = get_project_title(lines)
+    sections = [lines[start:end] for start, end in get_project_slices(lines, title)]
+    param_lines = [line for line in lines if '=' in line]
+    parsed_tables = [table for section in sections for table in identify_tables(section)[0]]
+
+    result = ConturResult.from_text(text, refine_amt=0)
+
+    def refine():
+        result.__dict__.pop('_spline_coefficients', None)
+        result.refine_coordinates(21)
+
+    timings = {
+        "identify_tables": _best_time(lambda: [identify_tables(section) for section in sections], repeat),
+        "get_params": _best_time(lambda: [get_params(line) for line in param_lines], repeat),
+        "table": _best_time(lambda: [ConturTable(data, headers) for headers, data in parsed_tables], repeat),
+        "refine_coordinates": _best_time(refine, repeat),
+        "from_text": _best_time(lambda: ConturResult.from_text(text), repeat),
+    }
+    sizes = {"lines": len(lines), "sections": len(sections), "param_lines": len(param_lines),
+             "tables": len(parsed_tables), "coordinates": len(result._coordinates.data)}
+    return timings, sizes
+
+
+def run(scales, repeat=5, seed=0):
+    record = {"commit": _git_commit(), "time": time.strftime("%Y-%m-%dT%H:%M:%S"), "python": platform.python_version(),
+              "numpy": np.__version__, "machine": platform.node(), "repeat": repeat, "cases": {}}
+    with warnings.catch_warnings():
+        # synthetic output reproduces the boundary layer rows CONTUR prints without extra parameters
+        warnings.simplefilter("ignore")
+        for scale in scales:
+            timings, sizes = bench_text(synthetic_output(scale, seed=seed), repeat=repeat)
+            record["cases"][f"{scale:g}"] = {"sizes": sizes, "timings": timings}
+    return record
+
+
+def load_records(filename):
+    if not os.path.exists(filename):
+        return []
+    with open(filename, 'r') as in_file:
+        return [json.loads(line) for line in in_file if line.strip()]
+
+
+def compare(record, previous, threshold=None):
+    # ratio new / old for every stage and scale the two records share; > 1 is slower
+    slower = []
+    print(f"{'scale':>8s} {'stage':>20s} {previous['commit'] or '?':>12s} {record['commit'] or '?':>12s} {'ratio':>8s}")
+    for scale, case in record["cases"].items():
+        if scale not in previous["cases"]:
+            continue
+        for stage, new in case["timings"].items():
+            old = previous["cases"][scale]["timings"].get(stage)
+            if old is None:
+                continue
+            ratio = new / old if old > 0 else np.inf
+            print(f"{scale:>8s} {stage:>20s} {old * 1e3:10.3f}ms {new * 1e3:10.3f}ms {ratio:8.2f}")
+            if threshold is not None and ratio > threshold:
+                slower.append((scale, stage, ratio))
+    return slower
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_read_output",
+                                     description="Time the CONTUR output parser on synthetic outputs")
+    parser.add_argument("--scale", type=float, nargs="+", default=[.25, 1., 4.],
+                        help="size of the synthetic output relative to a typical Mach 4 run")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=_DEFAULT_RESULTS, help="JSON lines file the results are appended to")
+    parser.add_argument("--no-save", action="store_true")
+    parser.add_argument("--compare", action="store_true",
+                        help="compare with the last saved record from a different commit")
+    parser.add_argument("--threshold", type=float, default=None,
+                        help="with --compare, exit with status 1 when any stage is this many times slower")
+    args = parser.parse_args(argv)
+
+    record = run(args.scale, repeat=args.repeat, seed=args.seed)
+    for scale, case in record["cases"].items():
+        print(f"scale {scale}: " + ", ".join([f"{key}={value}" for key, value in case["sizes"].items()]))
+        for stage, value in case["timings"].items():
+            print(f"{stage:>20s} {value * 1e3:10.3f} ms")
+
+    status = 0
+    if args.compare:
+        previous = [x for x in load_records(args.output) if x["commit"] != record["commit"]]
+        if previous:
+            slower = compare(record, previous[-1], args.threshold)
+            if slower:
+                print("slower than threshold: " + ", ".join([f"{stage} at scale {scale} ({ratio:.2f}x)"
+                                                             for scale, stage, ratio in slower]))
+                status = 1
+        else:
+            print(f"no earlier record from another commit in {args.output}")
+
+    if not args.no_save:
+        with open(args.output, 'a') as out_file:
+            out_file.write(json.dumps(record) + "\n")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
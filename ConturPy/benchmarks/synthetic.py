@@ -0,0 +1,285 @@
+import numpy as np
+
+# Synthetic CONTUR output in the layout of the Fortran print statements, for benchmarking the parser at any size. The
+# numbers come from a smooth made-up nozzle, not from a method of characteristics solution.
+
+_THROAT_VELOCITY_HEADER = "          Y/YO       U/A*          V/A*           W           MACH NO."
+_AXIAL_VELOCITY_HEADER = "          X/Y*         W                 WP                WPP               M             " \
+                         "    MP                MPP"
+_AXIS_HEADER = " POINT    X       X(IN)   MACH NO.    DM/DX        D2M/DX2       D3M/DX3       W=Q/A*     DW/DX      " \
+               "  D2W/DX2       D3W/DX3"
+_CHARACTERISTIC_HEADER = "        POINT        X              Y          MACH NO.     MACH ANG.(D)      PSI (D)      " \
+                         "FLOW ANG.(D)       X(IN)         Y(IN)"
+_UPSTREAM_HEADER = "                                   X           Y-CALC       Y-IN          DIFF"
+_WALL_HEADER = "        POINT        X              Y          MACH NO.      FLOW ANG.(D)     WALTAN         SECDIF"
+_STREAMLINE_HEADER = "          POINT X/YO        Y/YO       INT.Y/YO       PAR/YO       HYP/YO       C(Y)           " \
+                     "C(YI)          C(YP)"
+_BL_TITLE = "BOUNDARY LAYER CALCULATIONS, STAGNATION PRESSURE=  90.PSI, STAGNATION TEMPERATURE=1030. DEG R, N BASED" \
+            " ON RE,DELTA"
+_BL_METHODS = "      PARABOLIC TEMPERATURE DISTRIBUTION      MODIF. SPALDING-CHI REFERENCE TEMP      VAN DRIEST" \
+              " REFERENCE REYNOLDS NUMBER"
+_BL_HEADER = "      TW    TE    TAW    TP    RE/IN    RTHI    FRD     KCF1    KCF     RCFS     H      HI     FMY    " \
+             " KTHP THETA-1  DELTA  DELTA*-1"
+_BL_WALL_HEADER = "        STA(IN)     Y(IN)    DELR(IN)    R(IN)    DY/DX     D2Y/DX2      DA/DX     DR/DX    MACH" \
+                  " NO.    DM/DX    PE/PO       BETA"
+_COORDINATES_HEADER = "                  X(IN)          Y(IN)         DY/DX               ANGLE               D2Y/DX2" \
+                      "                       "
+
+
+def _blocks(rows, size=10):
+    # CONTUR prints tables in blocks of ten rows separated by a blank line
+    lines = []
+    for idx, row in enumerate(rows):
+        if idx > 0 and idx % size == 0:
+            lines.append("")
+        lines.append(row)
+    return lines
+
+
+class SyntheticNozzle(object):
+    def __init__(self, mach=4., characteristics=60, characteristic_points=61, axis_points=41, contour_points=65,
+                 bl_stations=65, coordinate_points=301, title="Synthetic", seed=0):
+        self.mach = mach
+        self.characteristics = characteristics
+        self.characteristic_points = characteristic_points
+        self.axis_points = axis_points
+        self.contour_points = contour_points
+        self.bl_stations = bl_stations
+        self.coordinate_points = coordinate_points
+        self.rng = np.random.default_rng(seed)
+
+        # the project title sits in columns 11-20 of the first line and in every section title line
+        self.name = f" {title[:8]:<9s}"
+        self.scale_factor = .13
+        self.throat_x = 56.927356
+        self.length = 3.0736441 * (1 + characteristics / 60) / 2
+        self.exit_y = 3.27395 * (1 + mach / 4) / 2
+
+    def _title(self, prefix, text):
+        return f"{prefix}{self.name}{text}"
+
+    def _noise(self, n, amount=1e-3):
+        return amount * self.rng.standard_normal(n)
+
+    def _wall(self, x):
+        # throat radius 1 growing smoothly to the exit radius, as function of x in [0, 1]
+        y = 1 + (self.exit_y - 1) * (3 * x ** 2 - 2 * x ** 3)
+        dy = (self.exit_y - 1) * (6 * x - 6 * x ** 2)
+        d2y = (self.exit_y - 1) * (6 - 12 * x)
+        return y, dy, d2y
+
+    def _mach(self, x):
+        return 1 + (self.mach - 1) * np.sqrt(np.clip(x, 0., 1.))
+
+    def throat_velocity_distribution(self):
+        y = np.linspace(0., 1., 25)
+        u = .96385164 + .075 * y ** 2
+        v = -.006 * np.sin(np.pi * y)
+        w = np.hypot(u, v)
+        mach = .95708127 + .09 * y ** 2
+        x = np.round(np.arange(0., 1.05, .1), 3)
+        lines = [self._title("          ", "  THROAT VELOCITY DISTRIBUTION, X=O, RC=  6.000000"), "",
+                 "          DERIVATIVES TAKEN WITH RESPECT TO X/Y*, WOP= 0.34136118", "",
+                 "          WOPP=  2.8328436E-03     WOPPP= -7.6881686E-02", "", _THROAT_VELOCITY_HEADER, "",
+                 *_blocks([f"{a:15.4f}{b:14.8f}{c:14.8f}{d:14.8f}{e:14.8f}"
+                           for a, b, c, d, e in zip(y, u, v, w, mach)]),
+                 "          FROM CUBIC, X/Y* = 0.10589172 FOR W= 1.0", "",
+                 "                      X/Y* = 0.30916451 FOR W= 1.06914514", "",
+                 "          CORRECTED WOPPP= -7.5023201E-02", "", "          RMASS = Y*/YO = 0.9997135747", "", "",
+                 "          AXIAL VELOCITY DISTRIBUTION, Y=0", "", _AXIAL_VELOCITY_HEADER, ""]
+        w = .96385164 + .34 * x
+        lines += [f"{a:14.3f}{b:18.7E}{.34 - .007 * a:18.7E}{.0028 - .075 * a:18.7E}{.957 + .43 * a:18.7E}"
+                  f"{.40 + .05 * a:18.7E}{.081 - .06 * a:18.7E}" for a, b in zip(x, w)]
+        return lines
+
+    def axis_contour(self):
+        n = self.axis_points
+        x = np.linspace(10.95576, .30914, n)
+        mach = self._mach(x / x[0])
+        columns = [np.arange(1, n + 1), x, self.throat_x + x * self.scale_factor, mach,
+                   np.gradient(mach, x), self._noise(n, .05), self._noise(n, .03),
+                   1 + .28 * mach, self._noise(n, .1), self._noise(n, .05), self._noise(n, .01)]
+        rows = [f"{int(p):4d}{a:10.5f}{b:10.5f}{c:10.6f}{d:14.6E}{e:14.6E}{f:14.6E}{g:10.6f}{h:14.6E}{i:14.6E}{j:14.6E}"
+                for p, a, b, c, d, e, f, g, h, i, j in zip(*columns)]
+        return [self._title("1 ", "   INVISCID CONTOUR, 4TH-DEGAXIAL MACH NUMBER DISTRIBUTION FROM THROAT"
+                                  " CHARACTERISTIC WHICH HAS  25 POINTS"), "",
+                f"     NO. OF POINTS ON 1ST CHAR. (M)={self.characteristic_points:3d}     NO. OF POINTS ON AXIS (N)="
+                f"{n:3d}     EPSI/ETA= 0.00000    BMACH={self.mach:9.5f}    CMACH={self.mach:9.5f}", "",
+                "     GAMMA= 1.4000     INFLECTION ANG. (ETA)= 60.0000  DEGREES     RAD. OF CURV. (RC)=   6.000000     "
+                "SCALE FACTOR (SF)=   0.13000000", "",
+                f"     Y*=1.00000000    RMASS=0.99971357    WWO= 1.0388387    WWOP= 0.39255278    "
+                f"EMACH={self.mach:8.5f}    FMACH={self.mach:10.7f}    GMACH=  0.00000", "",
+                "          WI=  1.06914514    WIP=  0.33865208    WIPP= -2.0359640E-02    MI=  1.08477784    MIP=  "
+                "0.42447041    MIPP=  6.9409656E-02", "",
+                "          C1=  1.0847778   C2=  4.51917456   C3=  3.9338093E+00   C4= -9.7642536E+00   C5=  "
+                "4.2264919E+00   C6=  0.0000000E+00", "",
+                "          XOI=  0.10589746   XI=  0.30913748   XO=  0.00000000   YO=  1.00028651   XIE= 10.64661872   "
+                "XE= 10.95575620    0 ITERATIONS", "",
+                "          MACH 0.95708127 AT 56.9273576 IN.,   MACH 1 AT 56.9411243 IN.,   MACH 1.08477784 AT"
+                " 56.9675455 IN.", "", "", "  AXIS", _AXIS_HEADER, "", *_blocks(rows)]
+
+    def _characteristic_rows(self, n, x0, x1, mach0, mach1):
+        x = np.linspace(x0, x1, n)
+        y = np.linspace(0., self.exit_y * (x1 - x0) / max(x1, 1e-9), n)
+        mach = np.linspace(mach0, mach1, n) + self._noise(n, 1e-5)
+        mach_angle = np.degrees(np.arcsin(1 / np.maximum(mach, 1.)))
+        psi = 65.78 * (mach - 1) / max(self.mach - 1, 1e-9)
+        flow_angle = np.abs(self._noise(n, 1e-3))
+        x_in = self.throat_x + x * self.scale_factor
+        y_in = y * self.scale_factor
+        return [f"{idx + 1:11d}{a:17.7E}{b:15.7E}{c:15.7E}{d:15.7E}{e:15.7E}{f:15.7E}{g:14.7f}{h:14.7f}"
+                for idx, (a, b, c, d, e, f, g, h)
+                in enumerate(zip(x, y, mach, mach_angle, psi, flow_angle, x_in, y_in))]
+
+    def throat_characteristic(self):
+        return [self._title("  ", "   THROAT CHARACTERISTIC"), "             ", _CHARACTERISTIC_HEADER, "",
+                *_blocks(self._characteristic_rows(25, .30913748, 0., 1.0847778, 1.0471638))]
+
+    def first_characteristic(self):
+        return [self._title("1 ", "   INVISCID CONTOUR"), "", "  CHARACT   1", _CHARACTERISTIC_HEADER, "",
+                *_blocks(self._characteristic_rows(self.characteristic_points, 10.955756, 23.635711, self.mach,
+                                                   self.mach)),
+                "         MASS = 1.0000000000", ""]
+
+    def left_characteristic(self, idx):
+        # left characteristics get shorter towards the exit as they meet the wall
+        n = max(3, int(round((self.characteristic_points + 3) * (1 - idx / self.characteristics) ** 1.5)))
+        x0 = 10.955756 * (1 - idx / (self.characteristics + 2))
+        rows = self._characteristic_rows(n, x0, 23.5, self.mach * (1 - .5 * idx / (self.characteristics + 2)),
+                                         self.mach)
+        return [self._title("  ", "   INTERMEDIATE LEFT CHARACTERISTIC"), "", f"  CHARACT{idx + 2:4d}",
+                _CHARACTERISTIC_HEADER, "", *_blocks(rows),
+                f"    CONTOUR    {23.290788:.7E}  {self.exit_y:.7E}  {self.mach:.7E}", ""]
+
+    def upstream_contour(self):
+        n = self.contour_points
+        x = 23.6357109 * np.linspace(0., 1., n) ** 1.5
+        y, _, _ = self._wall(x / x[-1])
+        diff = self._noise(n, 1e-5)
+        rows = [f"{idx + 1:26d}{a:15.7f}{b + c:13.7f}{b:13.7f}{c:13.7f}{idx + 1:8d}"
+                for idx, (a, b, c) in enumerate(zip(x, y, diff))]
+        return [self._title("  ", "      UPSTREAM CONTOUR, SMOOTHED   50 TIMES WITH FACTOR=0.85"), "", _UPSTREAM_HEADER,
+                "", *_blocks(rows), "                           MAX. ABSOLUTE ERROR =   1.133220E-02 AT POINT    29",
+                ""]
+
+    def right_characteristic(self):
+        rows = self._characteristic_rows(36, 10.955756, 2.9316544, self.mach, 2.4558294)
+        return [self._title("  ", "   INTERMEDIATE RIGHT CHARACTERISTIC"), "", "         LAST", _CHARACTERISTIC_HEADER,
+                "", *_blocks(rows)]
+
+    def _mach_line(self):
+        return f"  RC=   6.000000   ETAD= 60.0000 DEG   AMACH={self.mach:10.7f}   BMACH={self.mach:10.7f}   " \
+               f"CMACH={self.mach:10.7f}   EMACH={self.mach:10.7f}   GMACH=  0.0000000"
+
+    def wall_contour(self):
+        n = self.contour_points
+        x = 23.6357109 * np.linspace(0., 1., n) ** 1.5
+        y, dy, d2y = self._wall(x / x[-1])
+        mach = self._mach(x / x[-1])
+        flow_angle = np.degrees(np.arctan(dy / x[-1]))
+        rows = [f"{idx + 1:11d}{a:17.7E}{b:15.7E}{c:15.7E}{d:15.7E}{e / x[-1]:15.7E}{f / x[-1] ** 2:15.7E}"
+                for idx, (a, b, c, d, e, f) in enumerate(zip(x, y, mach, flow_angle, dy, d2y))]
+        return [self._title("1 ", "   INVISCID CONTOUR"), "", self._mach_line(), "", "         WALL", _WALL_HEADER, "",
+                *_blocks(rows), ""]
+
+    def streamline_contour(self):
+        n = self.contour_points
+        x = 23.6289410 * np.linspace(0., 1., n) ** 1.5
+        y, _, _ = self._wall(x / x[-1])
+        c = 3.4e-3 + self._noise(n, 1e-4)
+        rows = [f"{1:13d}{0.:13.7f}{1.:13.7f}{1.0002845:13.7f}{1.:13.7f}{1.:13.7f}"]
+        rows += [f"{idx + 1:13d}{a:13.7f}{b:13.7f}{b + 1e-5:13.7f}{a * 2:13.7f}{a * .4 + 1:13.7f}{d:15.6E}{d:15.6E}"
+                 f"{d * .7:15.6E}" for idx, (a, b, d) in enumerate(zip(x, y, c)) if idx > 0]
+        return [self._title("1 ", "   INVISCID CONTOUR"), "", self._mach_line(), "", _STREAMLINE_HEADER, "",
+                *_blocks(rows), "          ICY =    -15350300"]
+
+    def boundary_layer(self):
+        n = self.bl_stations
+        s = np.linspace(0., 1., n)
+        x = self.throat_x + self.length * s
+        te = 844.7 - 600 * s
+        h = .556 + 3.6 * s
+        fmy = 4.25 - 4.4 * s
+        theta = .00066 + .0052 * s
+        delta = .0047 + .074 * s
+        lines = [self._title("  ", "  " + _BL_TITLE), "", "", _BL_METHODS, "", _BL_HEADER, ""]
+        for idx in range(n):
+            lines.append(f"{idx + 1:4d}{540.:6.1f}{te[idx]:6.1f}{1010.7 - 62 * s[idx]:7.1f}{632.5 - 206 * s[idx]:6.1f}"
+                         f"{int(1039568 - 775000 * s[idx]):9d}{int(963 - 130 * s[idx]):7d}{1.385 - .876 * s[idx]:8.5f}"
+                         f"{4.20 + .15 * s[idx]:8.5f}{5.61 - 3.1 * s[idx]:8.5f}{5.61 - 3.1 * s[idx]:8.5f}{h[idx]:8.4f}"
+                         f"{1.4011 - .037 * s[idx]:7.4f}{fmy[idx]:8.5f}{1.25 * s[idx]:8.5f}{theta[idx]:9.6f}"
+                         f"{delta[idx]:7.4f}{theta[idx] * .4 + .0003:9.6f}")
+            if idx < 3 or (idx + 1) % 10 == 0:
+                lines.append(f"    X={x[idx]:7.3f},   DSU={delta[idx] * .3:8.5f},   THU={theta[idx] * 1.01:9.7f},   "
+                             f"CTH={theta[idx]:9.7f},   HU={h[idx] * .997:10.6f},   H={h[idx]:10.6f},   "
+                             f"CH={h[idx] * 1.01:10.6f},   N={4.98 + .5 * s[idx]:8.5f}")
+        lines += [f"    X={x[-1]:7.3f},   DELTA*= 0.0246702,   THETA=0.0058469,   H=  4.219349,   N= 5.4989360,   "
+                  f"DELTA=  0.0788854,   RE/FT=   3171344.", "",
+                  "                                   RE,THETA=    1545.,   LOG= 3.18899,                RE,DELTA=     "
+                  "20848.,   LOG= 4.31906", ""]
+        return lines
+
+    def nozzle_contour(self):
+        return [self._title("  ", "  NOZZLE CONTOUR, RADIAL FLOW ENDS AT STA   0.0000000, TEST CONE BEGINS AT STA  "
+                                  "58.3516059, SCALE FACTOR =   0.13000000"), "", self._mach_line(), "",
+                "  STAG. PRESSURE=  90. PSI, STAG. TEMPERATURE=1030. DEG R, THROAT TEMP.= 540. DEG R, WALL TEMP.=540. "
+                "DEG R, THROAT HT COEF.= 0.18002", "", ""]
+
+    def boundary_layer_wall(self):
+        n = self.bl_stations
+        s = np.linspace(0., 1., n)
+        x = self.throat_x + self.length * s
+        y, dy, d2y = self._wall(s)
+        y, dy, d2y = (y * self.scale_factor, dy * self.scale_factor / self.length,
+                      d2y * self.scale_factor / self.length ** 2)
+        mach = self._mach(s)
+        delr = .00037 + .0236 * s
+        rows = [f"{idx + 1:4d}{a:11.6f}{b:11.6f}{c:11.7f}{b + c:11.7f}{d:10.7f}{e:10.7f}{.0013 + .004 * t:10.7f}"
+                f"{d + .0013:10.7f}{m:11.7f}{3.7 * (1 - t):10.7f}{.5 * (1 - t) + .0066:12.4E}{-.51 * (1 - t):12.4E}"
+                for idx, (a, b, c, d, e, t, m) in enumerate(zip(x, y, delr, dy, d2y, s, mach))]
+        return [self._title("  ", "  " + _BL_TITLE), "", "", _BL_METHODS, "", _BL_WALL_HEADER, "", *_blocks(rows), "",
+                f" STA{x[0]:11.6f}      Y*=  0.1304043,     D2A/DX2= 0.006383649,     D2R/DX2= 1.288064503,     "
+                f"VISCID RC=    5.95347358", ""]
+
+    def coordinates(self):
+        n = self.coordinate_points
+        s = np.linspace(0., 1., n)
+        y, dy, d2y = self._wall(s)
+        x = self.throat_x + self.length * s
+        y, dy, d2y = (y * self.scale_factor, dy * self.scale_factor / self.length,
+                      d2y * self.scale_factor / self.length ** 2)
+        angle = np.degrees(np.arctan(dy))
+        rows = [f"{a:24.6f}{b:15.6f}{c:20.8E}{d:20.8E}{e:20.8E}" for a, b, c, d, e in zip(x, y, dy, angle, d2y)]
+        lines = []
+        # one section per 50 wall points, each with its own title and header
+        for start in range(0, n, 50):
+            lines += [self._title("           ", f"  COORDINATES AND DERIVATIVES, LENGTH={self.length:12.7f}"), "",
+                      _COORDINATES_HEADER, "", *_blocks(rows[start:start + 50]), ""]
+        return lines
+
+    def lines(self):
+        lines = [*self.throat_velocity_distribution(), *self.axis_contour(), *self.throat_characteristic(),
+                 *self.first_characteristic()]
+        for idx in range(self.characteristics):
+            lines += self.left_characteristic(idx)
+        lines += [*self.upstream_contour(), *self.right_characteristic(), *self.wall_contour(),
+                  *self.streamline_contour(), *self.boundary_layer(), *self.boundary_layer(), *self.nozzle_contour(),
+                  *self.boundary_layer_wall(), *self.coordinates()]
+        return lines
+
+    def text(self):
+        return "\n".join(self.lines()) + "\n"
+
+    def write(self, filename):
+        with open(filename, 'w') as out_file:
+            out_file.write(self.text())
+        return filename
+
+
+def synthetic_output(scale=1., seed=0, **kwargs):
+    # sizes of a typical Mach 4 run, multiplied by scale
+    sizes = {"characteristics": 60, "characteristic_points": 61, "axis_points": 41, "contour_points": 65,
+             "bl_stations": 65, "coordinate_points": 301}
+    sizes = {key: max(2, int(round(value * scale))) for key, value in sizes.items()}
+    sizes.update(kwargs)
+    return SyntheticNozzle(seed=seed, **sizes).text()
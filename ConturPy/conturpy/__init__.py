@@ -1,10 +1,35 @@
-from .create_input_cards import ConturSettings
-from .read_output import ConturResult
-from .run_contur import ConturApplication
-from .plot_results import gen_bl_thickness_plot, gen_bl_temperature_plot, gen_noz_characteristics, \
-    gen_throat_characteristics, gen_contours, gen_flow_angles, gen_flow_angles_throat
-from .create_report import save_all
-
-__all__ = ["ConturSettings", "ConturResult", "ConturApplication",
+from .create_input_cards import ConturSettings, ConturSettingsBatch
+from .read_output import ConturResult, ConturSectionReader, ConturTailReader, ConturDataset
+from .run_contur import ConturApplication, ConturFailure
+from .cache import ConturCache
+from .sweep import ConturSweep
+from .optimize import ConturOptimizer
+from .scheduler import ConturScheduler
+from .metrics import ConturMetrics
+
+# the plotting and report functions import matplotlib and scipy, so they are only loaded on first use; so is
+# conturpy.distributed, which is also run as a script and must not be imported with the package
+_lazy = {"gen_bl_thickness_plot": "plot_results", "gen_bl_temperature_plot": "plot_results",
+         "gen_noz_characteristics": "plot_results", "gen_throat_characteristics": "plot_results",
+         "gen_contours": "plot_results", "gen_flow_angles": "plot_results", "gen_flow_angles_throat": "plot_results",
+         "save_all": "create_report", "ConturSpoolCoordinator": "distributed", "ConturSpoolWorker": "distributed"}
+
+
+def __getattr__(name):
+    if name not in _lazy:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    value = getattr(importlib.import_module(f".{_lazy[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted([*globals(), *_lazy])
+
+
+__all__ = ["ConturSettings", "ConturSettingsBatch", "ConturResult", "ConturSectionReader", "ConturTailReader",
+           "ConturDataset", "ConturApplication", "ConturFailure", "ConturCache", "ConturSweep", "ConturOptimizer",
+           "ConturScheduler", "ConturMetrics", "ConturSpoolCoordinator", "ConturSpoolWorker",
            "gen_bl_temperature_plot", "gen_bl_thickness_plot", "gen_noz_characteristics", "gen_throat_characteristics",
            "gen_contours", "gen_flow_angles", "gen_flow_angles_throat", "save_all"]
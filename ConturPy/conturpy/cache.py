@@ -0,0 +1,189 @@
+import hashlib
+import os
+import pickle
+import shutil
+import threading
+import time
+from .read_output import ConturResult
+
+
+def executable_identity(executable):
+    digest = hashlib.sha256()
+    with open(executable, 'rb') as exe_file:
+        for chunk in iter(lambda: exe_file.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ConturCache(object):
+    # put() rescans the directory only when its running total crosses max_size, and every _scan_every puts to take
+    # in max_age and the entries written by other processes; eviction then goes down to _low_water of max_size so
+    # that a full cache is not rescanned on every put
+    _scan_every = 64
+    _low_water = 0.9
+
+    def __init__(self, directory, max_size=None, max_age=None):
+        self.directory = directory
+        self.max_size = max_size
+        self.max_age = max_age
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        # bytes on disk as of the last scan plus what has been put since, None until the first scan
+        self._size = None
+        self._puts = 0
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+
+    @staticmethod
+    def key(deck, identity):
+        return hashlib.sha256(f"{identity}\n{deck}".encode()).hexdigest()
+
+    def _paths(self, key):
+        return os.path.join(self.directory, key + '.txt'), os.path.join(self.directory, key + '.pkl')
+
+    def _count(self, name, n=1):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + n)
+
+    def _counts(self):
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+    def get(self, key, refine_amt=21, dest=None):
+        output_file, result_file = self._paths(key)
+        if not os.path.exists(output_file) or (self.max_age is not None and
+                                               time.time() - os.path.getmtime(output_file) > self.max_age):
+            self._count('misses')
+            return None
+
+        try:
+            with open(result_file, 'rb') as in_file:
+                stored_refine_amt, result = pickle.load(in_file)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            stored_refine_amt, result = None, None
+
+        try:
+            if dest is not None:
+                shutil.copyfile(output_file, dest)
+            if result is None or stored_refine_amt != refine_amt:
+                result = ConturResult(output_file, refine_amt=refine_amt)
+        except FileNotFoundError:
+            # evicted by another worker between the checks above
+            self._count('misses')
+            return None
+        result.filename = output_file if dest is None else dest
+
+        # entries are aged by last use, so touch both files on every hit
+        for path in (output_file, result_file):
+            if os.path.exists(path):
+                os.utime(path)
+        self._count('hits')
+        return result
+
+    @staticmethod
+    def _file_size(path):
+        try:
+            return os.path.getsize(path)
+        except FileNotFoundError:
+            return 0
+
+    def put(self, key, output, result=None, refine_amt=21):
+        cached_output, cached_result = self._paths(key)
+        tmp_suffix = f".{os.getpid()}.{threading.get_ident()}.tmp"
+        replaced = sum(self._file_size(path) for path in (cached_output, cached_result))
+
+        with open(cached_output + tmp_suffix, 'w') as out_file:
+            out_file.write(output)
+        os.replace(cached_output + tmp_suffix, cached_output)
+        if result is not None:
+            with open(cached_result + tmp_suffix, 'wb') as out_file:
+                pickle.dump((refine_amt, result), out_file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(cached_result + tmp_suffix, cached_result)
+
+        if self.max_size is None and self.max_age is None:
+            return
+        added = sum(self._file_size(path) for path in (cached_output, cached_result)) - replaced
+        with self._lock:
+            self._puts += 1
+            if self._size is not None:
+                self._size += added
+            scan = self._size is None or self._puts % self._scan_every == 0 or \
+                (self.max_size is not None and self._size > self.max_size)
+        if scan:
+            self._evict(None if self.max_size is None else self.max_size * self._low_water)
+
+    def _entries(self):
+        entries = {}
+        for name in os.listdir(self.directory):
+            key, ext = os.path.splitext(name)
+            if ext not in ('.txt', '.pkl'):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                continue
+            size, mtime = entries.get(key, (0, 0))
+            entries[key] = (size + stat.st_size, max(mtime, stat.st_mtime))
+        return entries
+
+    def _remove(self, key):
+        removed = False
+        for path in self._paths(key):
+            try:
+                os.remove(path)
+                removed = True
+            except FileNotFoundError:
+                pass
+        if removed:
+            self._count('evictions')
+
+    def evict(self):
+        self._evict(self.max_size)
+
+    def _evict(self, target_size):
+        entries = self._entries()
+        now = time.time()
+
+        if self.max_age is not None:
+            for key in [key for key, (_, mtime) in entries.items() if now - mtime > self.max_age]:
+                self._remove(key)
+                del entries[key]
+
+        total_size = sum(size for size, _ in entries.values())
+        if self.max_size is not None and total_size > self.max_size:
+            for key, (size, _) in sorted(entries.items(), key=lambda item: item[1][1]):
+                if total_size <= target_size:
+                    break
+                self._remove(key)
+                total_size -= size
+        with self._lock:
+            self._size = total_size
+
+    def clear(self):
+        for key in self._entries():
+            self._remove(key)
+        with self._lock:
+            self._size = 0
+
+    def stats(self):
+        entries = self._entries()
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "entries": len(entries), "size": sum(size for size, _ in entries.values())}
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        stats = self.stats()
+        return f"ConturCache at {self.directory}:\n" \
+               f"{stats['entries']:15g} entries\n" \
+               f"{stats['hits']:15g} hits\n" \
+               f"{stats['misses']:15g} misses"
@@ -1,23 +1,27 @@
+import copy
+import itertools
+import math
 import os
+from .metrics import instrumented
 
 
 def reduce_g(num):
+    # 10 significant digits, cut down to the 10 characters of a CONTUR field (from the end of the mantissa for
+    # exponent notation) and padded
     g_str = f"{num:<.10G}"
 
     if '.' not in g_str:
         g_str += '.'
 
-    while len(g_str) > 10:
+    excess = len(g_str) - 10
+    if excess > 0:
         if 'E' in g_str:
-            sp_str = g_str.split('E')
-            g_str = sp_str[0][:-1] + 'E' + sp_str[1]
+            mantissa, exponent = g_str.split('E', 1)
+            g_str = mantissa[:-excess] + 'E' + exponent
         else:
-            g_str = g_str[:-1]
+            g_str = g_str[:10]
 
-    while len(g_str) < 10:
-        g_str += ' '
-
-    return g_str
+    return f"{g_str:<10}"
 
 
 class ConturCard(object):
@@ -27,20 +31,57 @@ class ConturCard(object):
         self.card_widths = [] if widths is None else widths
         self.card_aligns = [] if aligns is None else aligns
 
-    def print(self) -> str:
-        aligns = self.card_aligns
-        widths = self.card_widths
+    def _field_width(self, idx):
+        return self.card_widths[0] if len(self.card_widths) == 1 else self.card_widths[idx]
+
+    def _field_format(self, idx):
+        # the function turning the value of field idx into the text CONTUR reads
+        width = self._field_width(idx)
+        if width == -1:
+            return reduce_g
 
         if len(self.card_aligns) == 0:
-            aligns = ["<" for _ in range(len(self.card_labels))]
+            align = "<"
         elif len(self.card_aligns) == 1:
-            aligns = [self.card_aligns[0] for _ in range(len(self.card_labels))]
-
-        if len(self.card_widths) == 1:
-            widths = [self.card_widths[0] for _ in range(len(self.card_labels))]
+            align = self.card_aligns[0]
+        else:
+            align = self.card_aligns[idx]
+        return f"{{:{align}{width}}}".format
+
+    def _field_formats(self):
+        return [self._field_format(idx) for idx in range(len(self.card_values))]
+
+    def _field_problem(self, idx, value, rtol=1e-3):
+        # None if CONTUR reads the value back as given, otherwise what goes wrong
+        label = self.card_labels[idx]
+        width = self._field_width(idx)
+        try:
+            text = self._field_format(idx)(value)
+        except (TypeError, ValueError):
+            kind = "a real number" if width == -1 else f"an integer ({width})"
+            return f"{label}={value!r} is not {kind}"
+
+        if width != -1:
+            if len(text) > int(width.rstrip('d')):
+                return f"{label}={value} is wider than its {width.rstrip('d')} columns"
+            return None
+
+        if not math.isfinite(float(value)):
+            return f"{label}={value} is not finite"
+        try:
+            written = float(text)
+        except ValueError:
+            return f"{label}={value} is written as '{text.strip()}', which CONTUR cannot read"
+        if abs(written - value) > rtol * abs(value):
+            return f"{label}={value} is cut to '{text.strip()}' to fit 10 columns"
+        return None
+
+    def _field_problems(self, rtol=1e-3):
+        problems = [self._field_problem(idx, value, rtol) for idx, value in enumerate(self.card_values)]
+        return [(label, problem) for label, problem in zip(self.card_labels, problems) if problem is not None]
 
-        return "".join([f"{val:{aligns[idx]}{widths[idx]}}" if widths[idx] != -1 else reduce_g(val)
-                        for idx, val in enumerate(self.card_values)])
+    def print(self) -> str:
+        return "".join([fmt(val) for fmt, val in zip(self._field_formats(), self.card_values)])
 
     def to_dict(self):
         return dict(zip(self.card_labels, self.card_values))
@@ -52,21 +93,33 @@ class ConturCard(object):
         return "".join([f"{label}: {value}\n" for label, value in zip(self.card_labels, self.card_values)])
 
     def __getitem__(self, label: str):
-        if label in self.card_labels:
+        try:
             return self.card_values[self.card_labels.index(label)]
-        else:
-            raise AttributeError(f"Card label {label} not found")
+        except ValueError:
+            raise AttributeError(f"Card label {label} not found") from None
 
     def __setitem__(self, label, value):
-        if label in self.card_labels:
+        try:
             self.card_values[self.card_labels.index(label)] = value
-        else:
-            raise AttributeError(f"Card label {label} not found")
+        except ValueError:
+            raise AttributeError(f"Card label {label} not found") from None
 
 
 class ConturCard1(ConturCard):
-    def print(self) -> str:
-        return f" {self.card_values[0]:^10.10s}  {self.card_values[1]:<2d}"
+    def _field_format(self, idx):
+        return [" {:^10.10s}  ".format, "{:<2d}".format][idx]
+
+    def _field_problem(self, idx, value, rtol=1e-3):
+        if idx == 0:
+            if not isinstance(value, str):
+                return f"ITLE={value!r} is not a string"
+            # CONTUR reads the title as three 4-character words and stops at a title whose first word is blank
+            if not self._field_format(0)(value)[:4].strip():
+                return f"ITLE='{value}' leaves the first 4 columns of card 1 blank, CONTUR reads that as end of input"
+            return None
+        if value not in (0, -1) or isinstance(value, float):
+            return f"JD={value!r} must be 0 (axisymmetric) or -1 (planar)"
+        return None
 
 
 class ConturSettings(object):
@@ -124,9 +177,13 @@ class ConturSettings(object):
 
         self._card_deck = [self._card1, self._card2, self._card3, self._card4, self._cardA, self._cardB,
                            self._cardC, self._cardD]
-        self._str_fields = [card.card_labels for card in self._card_deck]
+        # ETAD is on card 3 and card C, labels resolve to the first card that has them
+        self._label_cards = {}
+        for card in self._card_deck:
+            for label in card.card_labels:
+                self._label_cards.setdefault(label, card)
 
-    def get_deck(self) -> str:
+    def _deck_cards(self):
         card5 = None
         card6 = None
         card7 = None
@@ -152,37 +209,225 @@ class ConturSettings(object):
         elif self._smooth_inviscid_contour and self._include_bl and self._use_spline:
             card7 = self._cardD
 
-        return "".join([
-            self._card1.print() + "\n",
-            self._card2.print() + "\n",
-            self._card3.print() + "\n",
-            self._card4.print() + "\n",
-            card5.print() + "\n" if card5 is not None else "",
-            card6.print() + "\n" if card6 is not None else "",
-            card7.print() + "\n" if card7 is not None else "",
-        ])
+        return [card for card in [self._card1, self._card2, self._card3, self._card4, card5, card6, card7]
+                if card is not None]
 
+    def get_deck(self) -> str:
+        return "".join([card.print() + "\n" for card in self._deck_cards()])
+
+    def _read_cards(self):
+        # the cards CONTUR reads after card 4, in order: A when NF < 0 (contour smoothing), C when JX > 0 (streamlines),
+        # B when JB > 0 (boundary layer) and D when XBL = 1000 (spline fit)
+        return [name for name, needed in [("A", self["NF"] < 0), ("C", self["JX"] > 0), ("B", self["JB"] > 0),
+                                          ("D", self["XBL"] == 1000)] if needed]
+
+    def _value_problems(self, cards):
+        problems = []
+        written = ["1234ABCD"[self._card_deck.index(card)] for card in cards[4:]]
+        checks = [
+            (lambda: written == self._read_cards(),
+             lambda: f"cards after card 4 are [{', '.join(written)}] but CONTUR reads [{', '.join(self._read_cards())}]"
+                     f" for NF={self['NF']}, JX={self['JX']}, JB={self['JB']}, XBL={self['XBL']}"),
+            # out of range values that CONTUR runs with until it times out or stops without output
+            (lambda: self["GAM"] > 1, lambda: f"GAM={self['GAM']} must be above 1"),
+            (lambda: abs(self["CMC"]) > 1,
+             lambda: f"CMC={self['CMC']} must be above 1 in magnitude (design Mach number)"),
+            (lambda: 0 < self["ETAD"] <= 60, lambda: f"ETAD={self['ETAD']} must be in (0, 60] degrees"),
+            (lambda: self["ETAD"] == 60 or self["BMACH"] > 1,
+             lambda: f"BMACH={self['BMACH']} must be above 1 when ETAD is not 60"),
+            (lambda: self["MD"] <= 125, lambda: f"MD={self['MD']} points on AB is more than 125"),
+            (lambda: self["ND"] <= 150, lambda: f"ND={self['ND']} points on BC is more than 150"),
+            (lambda: abs(self["LR"]) + abs(self["NT"]) <= 149,
+             lambda: f"abs(LR) + abs(NT) = {abs(self['LR']) + abs(self['NT'])} is more than 149"),
+        ]
+        for check, problem in checks:
+            try:
+                if not check():
+                    problems.append(problem())
+            except TypeError:
+                # values of the wrong type are reported by the field checks
+                pass
+        return problems
+
+    def validate(self, rtol=1e-3):
+        # everything found that would stop this deck from running, an empty list if there is nothing
+        try:
+            cards = self._deck_cards()
+        except AttributeError as err:
+            return [f"the deck cannot be written: {err}"]
+        problems = [problem for card in cards for _, problem in card._field_problems(rtol)]
+        return problems + self._value_problems(cards)
+
+    @instrumented("print_to_input")
     def print_to_input(self, file_name=None, output_directory=None):
         file_name = 'input.txt' if file_name is None else file_name
         file_path = file_name if output_directory is None else os.path.join(output_directory, file_name)
         with open(file_path, 'w') as out_file:
             out_file.write(self.get_deck())
 
-    def __getitem__(self, label: str):
-        is_present = [label in row for row in self._str_fields]
-
-        if not any(is_present):
-            raise AttributeError(f"Card label {label} not found")
+    def _card(self, label: str):
+        try:
+            return self._label_cards[label]
+        except KeyError:
+            raise AttributeError(f"Card label {label} not found") from None
 
-        return self._card_deck[is_present.index(True)][label]
+    def __getitem__(self, label: str):
+        return self._card(label)[label]
 
     def __setitem__(self, label: str, value):
-        is_present = [label in row for row in self._str_fields]
+        self._card(label)[label] = value
+
+
+class ConturSettingsBatch(object):
+    def __init__(self, values, base_settings=None):
+        # values maps card labels to equal-length sequences; each index is one deck, every other card keeps the value
+        # it has in base_settings
+        self.base_settings = ConturSettings() if base_settings is None else base_settings
+        self.values = {label: self._column(label, column) for label, column in values.items()}
+
+        lengths = {len(column) for column in self.values.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"All value arrays must have the same length, got lengths {sorted(lengths)}")
+        self._num_decks = lengths.pop() if lengths else 0
+
+    def _column(self, label, column):
+        base_value = self.base_settings[label]  # raises AttributeError for unknown card labels
+        column = column.tolist() if hasattr(column, 'tolist') else list(column)
+        if isinstance(base_value, int):
+            # integer cards stay integers when the values given for them are whole numbers
+            column = [int(value) if isinstance(value, float) and value.is_integer() else value for value in column]
+        return column
+
+    def __len__(self):
+        return self._num_decks
+
+    def __getitem__(self, idx):
+        if not -len(self) <= idx < len(self):
+            raise IndexError("ConturSettingsBatch index out of range")
+        settings = copy.deepcopy(self.base_settings)
+        for label, column in self.values.items():
+            settings[label] = column[idx]
+        return settings
+
+    def __iter__(self):
+        for idx in range(len(self)):
+            yield self[idx]
+
+    def _card_lines(self, card):
+        # the card's line for every deck, or a single line when none of its fields change
+        fields = []
+        for fmt, label, value in zip(card._field_formats(), card.card_labels, card.card_values):
+            if label in self.values and self.base_settings._card(label) is card:
+                fields.append([fmt(x) for x in self.values[label]])
+            else:
+                fields.append(fmt(value))
+
+        if all(isinstance(field, str) for field in fields):
+            return "".join(fields) + "\n"
+        fields = [itertools.repeat(field) if isinstance(field, str) else field for field in fields]
+        return ["".join(line) + "\n" for line in zip(*fields)]
+
+    def _deck_layouts(self):
+        # which cards make up each deck; only JX and JB change that between decks
+        labels = [label for label in ("JX", "JB") if label in self.values]
+        layouts = {}
+        for idx, key in enumerate(zip(*[self.values[label] for label in labels]) if labels else [()] * len(self)):
+            layouts.setdefault(key, []).append(idx)
+        return labels, layouts
+
+    def decks(self):
+        base = self.base_settings
+        labels, layouts = self._deck_layouts()
+        card_lines = {}
+        decks = [None] * len(self)
+        for key, indices in layouts.items():
+            settings = copy.deepcopy(base)
+            for label, value in zip(labels, key):
+                settings[label] = value
+            cards = [base._card_deck[settings._card_deck.index(card)] for card in settings._deck_cards()]
+            for card in cards:
+                if id(card) not in card_lines:
+                    card_lines[id(card)] = self._card_lines(card)
+            lines = [card_lines[id(card)] for card in cards]
+
+            if len(layouts) == 1:
+                columns = [itertools.repeat(line, len(self)) if isinstance(line, str) else line for line in lines]
+                return ["".join(deck) for deck in zip(*columns)]
+            for idx in indices:
+                decks[idx] = "".join([line if isinstance(line, str) else line[idx] for line in lines])
+        return decks
+
+    def validate(self, rtol=1e-3):
+        # the problems ConturSettings.validate finds, by index of every deck that has any; fields every deck shares are
+        # checked once
+        scratch = copy.deepcopy(self.base_settings)
+        varied = {(id(scratch._card(label)), label) for label in self.values}
+        shared = {}
+        problems = {}
+        for idx in range(len(self)):
+            for label, column in self.values.items():
+                scratch[label] = column[idx]
+            try:
+                cards = scratch._deck_cards()
+            except AttributeError as err:
+                problems[idx] = [f"the deck cannot be written: {err}"]
+                continue
+
+            deck_problems = []
+            for card in cards:
+                if id(card) not in shared:
+                    shared[id(card)] = [problem for label, problem in card._field_problems(rtol)
+                                        if (id(card), label) not in varied]
+                deck_problems += shared[id(card)]
+            for label, column in self.values.items():
+                card = scratch._card(label)
+                if card in cards:
+                    problem = card._field_problem(card.card_labels.index(label), column[idx], rtol)
+                    if problem is not None:
+                        deck_problems.append(problem)
+            deck_problems += scratch._value_problems(cards)
+
+            if deck_problems:
+                problems[idx] = deck_problems
+        return problems
+
+    def take(self, indices):
+        return ConturSettingsBatch({label: [column[idx] for idx in indices] for label, column in self.values.items()},
+                                   self.base_settings)
+
+    def _indexed_decks(self, indices):
+        if indices is None:
+            return enumerate(self.decks())
+        indices = list(indices)
+        return zip(indices, self.take(indices).decks())
+
+    @instrumented("print_to_input")
+    def print_to_inputs(self, output_directory, file_name="case{idx:06d}.txt", indices=None):
+        # one deck file per case in output_directory, file_name is formatted with the case index; indices picks a subset
+        file_paths = []
+        for idx, deck in self._indexed_decks(indices):
+            file_path = os.path.join(output_directory, file_name.format(idx=idx))
+            with open(file_path, 'w') as out_file:
+                out_file.write(deck)
+            file_paths.append(file_path)
+        return file_paths
+
+    @instrumented("print_to_input")
+    def write_jobs(self, output_directory, job_name="job{idx:06d}", file_name="input.txt", indices=None):
+        # one directory per case holding the deck as input.txt, ready to run CONTUR in
+        job_dirs = []
+        for idx, deck in self._indexed_decks(indices):
+            job_dir = os.path.join(output_directory, job_name.format(idx=idx))
+            os.makedirs(job_dir, exist_ok=True)
+            with open(os.path.join(job_dir, file_name), 'w') as out_file:
+                out_file.write(deck)
+            job_dirs.append(job_dir)
+        return job_dirs
 
-        if not any(is_present):
-            raise AttributeError(f"Card label {label} not found")
-
-        self._card_deck[is_present.index(True)][label] = value
+    def __repr__(self):
+        return f"ConturSettingsBatch:\n" \
+               f"{len(self):15g} decks\n" + \
+               "".join([f"{label:>15s}: {len(set(column))} values\n" for label, column in self.values.items()])
 
 
 if __name__ == "__main__":
@@ -1,6 +1,7 @@
 import numpy as np
 import os
 import matplotlib.pyplot as plt
+from .metrics import instrumented, timed
 from .plot_results import gen_bl_thickness_plot, gen_bl_temperature_plot, gen_noz_characteristics, \
     gen_throat_characteristics, gen_contours, gen_flow_angles, gen_flow_angles_throat
 
@@ -21,6 +22,7 @@ def save_group(subsection, base_name, directory):
             save_table(individual.tables[0], directory, base_name, idx)
 
 
+@instrumented("save_all")
 def save_all(r, directory):
     if not os.path.exists(directory):
         os.mkdir(directory)
@@ -44,6 +46,7 @@ def save_all(r, directory):
                       "Throat_Characteristics.png", "Contours.png", "Flow_Angles.png", "Flow_Angles_At_Throat.png"]
 
     for plot_fun, plot_name in zip(plot_functions, plot_fun_names):
-        f, ax = plot_fun(r)
-        f.savefig(os.path.join(directory, plot_name))
+        with timed(plot_fun.__name__):
+            f, ax = plot_fun(r)
+            f.savefig(os.path.join(directory, plot_name))
         plt.close()
@@ -0,0 +1,224 @@
+import argparse
+import json
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from .read_output import ConturResult
+from .run_contur import ConturApplication, ConturFailure
+
+# A spool directory on a filesystem shared by every machine (NFS, SMB, ...) acts as the job queue:
+#   jobs/<id>.json     decks waiting to be run
+#   claimed/<id>.json  decks a worker has taken, moved there with an atomic rename so each job runs once
+#   results/<id>.npz   the ConturResult, as written by ConturResult.save
+#   results/<id>.json  or the ConturFailure
+#   stop               tells the workers to exit once the queue is empty
+# Results are plain arrays and JSON, never pickles, so reading them cannot run code planted in the spool
+_SUBDIRS = ("jobs", "claimed", "results")
+
+
+def _make_spool(spool_dir):
+    for sub_dir in _SUBDIRS:
+        os.makedirs(os.path.join(spool_dir, sub_dir), exist_ok=True)
+
+
+def _tmp_path(path):
+    return f"{path}.{socket.gethostname()}.{os.getpid()}.tmp"
+
+
+def _atomic_write(path, data, mode='wb'):
+    tmp_path = _tmp_path(path)
+    with open(tmp_path, mode) as out_file:
+        out_file.write(data)
+    os.replace(tmp_path, path)
+
+
+def _result_file(spool_dir, job_id):
+    for ext in ('.npz', '.json'):
+        path = os.path.join(spool_dir, 'results', job_id + ext)
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def _read_result(path):
+    if path.endswith('.npz'):
+        return ConturResult.load(path, mmap_mode=False)
+    with open(path, 'r') as in_file:
+        return ConturFailure(**json.load(in_file))
+
+
+class ConturSpoolCoordinator(object):
+    def __init__(self, spool_dir):
+        self.spool_dir = spool_dir
+        _make_spool(spool_dir)
+        stop_file = os.path.join(spool_dir, 'stop')
+        if os.path.exists(stop_file):
+            os.remove(stop_file)
+
+    def submit(self, decks, refine_amt=21):
+        job_ids = []
+        for deck in decks:
+            deck = deck.get_deck() if hasattr(deck, 'get_deck') else deck
+            # time prefixed so that workers, which claim in name order, run jobs first in first out
+            job_id = f"{time.time_ns():020d}-{uuid.uuid4().hex[:8]}"
+            _atomic_write(os.path.join(self.spool_dir, 'jobs', job_id + '.json'),
+                          json.dumps({"deck": deck, "refine_amt": refine_amt}), mode='w')
+            job_ids.append(job_id)
+        return job_ids
+
+    def requeue_stale(self, max_age):
+        # jobs claimed by a worker that died are put back in the queue
+        requeued = 0
+        claimed_dir = os.path.join(self.spool_dir, 'claimed')
+        for name in os.listdir(claimed_dir):
+            job_id = os.path.splitext(name)[0]
+            path = os.path.join(claimed_dir, name)
+            try:
+                stale = time.time() - os.path.getmtime(path) > max_age
+                if stale and _result_file(self.spool_dir, job_id) is None:
+                    os.rename(path, os.path.join(self.spool_dir, 'jobs', name))
+                    requeued += 1
+            except FileNotFoundError:
+                pass
+        return requeued
+
+    def gather(self, job_ids, timeout=None, poll=0.1, requeue_after=None):
+        results = {}
+        start = time.perf_counter()
+        while len(results) < len(job_ids):
+            for job_id in job_ids:
+                if job_id in results:
+                    continue
+                path = _result_file(self.spool_dir, job_id)
+                if path is not None:
+                    results[job_id] = _read_result(path)
+                    os.remove(path)
+                    claimed = os.path.join(self.spool_dir, 'claimed', job_id + '.json')
+                    if os.path.exists(claimed):
+                        os.remove(claimed)
+
+            if len(results) == len(job_ids):
+                break
+            if timeout is not None and time.perf_counter() - start > timeout:
+                for job_id in job_ids:
+                    if job_id not in results:
+                        results[job_id] = ConturFailure(job_id, "lost", f"no result within {timeout:g} s")
+                break
+            if requeue_after is not None:
+                self.requeue_stale(requeue_after)
+            time.sleep(poll)
+
+        return [results[job_id] for job_id in job_ids]
+
+    def map(self, decks, refine_amt=21, timeout=None, poll=0.1, requeue_after=None):
+        return self.gather(self.submit(decks, refine_amt=refine_amt), timeout=timeout, poll=poll,
+                           requeue_after=requeue_after)
+
+    def shutdown(self):
+        open(os.path.join(self.spool_dir, 'stop'), 'w').close()
+
+    def pending(self):
+        return len(os.listdir(os.path.join(self.spool_dir, 'jobs')))
+
+    def __repr__(self):
+        return f"ConturSpoolCoordinator at {self.spool_dir}:\n{self.pending():15g} pending jobs"
+
+
+class ConturSpoolWorker(object):
+    def __init__(self, spool_dir, application=None):
+        self.spool_dir = spool_dir
+        self.application = ConturApplication() if application is None else application
+        self.runs = 0
+        _make_spool(spool_dir)
+
+    def claim(self):
+        jobs_dir = os.path.join(self.spool_dir, 'jobs')
+        for name in sorted(os.listdir(jobs_dir)):
+            if not name.endswith('.json'):
+                continue
+            claimed = os.path.join(self.spool_dir, 'claimed', name)
+            try:
+                os.rename(os.path.join(jobs_dir, name), claimed)
+            except (FileNotFoundError, PermissionError):
+                # another worker got there first
+                continue
+            os.utime(claimed)
+            return os.path.splitext(name)[0], claimed
+        return None, None
+
+    def run_job(self, job_id, claimed, wd):
+        with open(claimed, 'r') as in_file:
+            job = json.load(in_file)
+        result = self.application._run_deck(job["deck"], job_id, refine_amt=job["refine_amt"], wd=wd)
+        path = os.path.join(self.spool_dir, 'results', job_id)
+        if isinstance(result, ConturFailure):
+            detail = None if result.detail is None else str(result.detail)
+            _atomic_write(path + '.json', json.dumps({"source": result.source, "reason": result.reason,
+                                                      "detail": detail}), mode='w')
+        else:
+            tmp_path = _tmp_path(path + '.npz')
+            result.save(tmp_path, raw=self.application.keep_raw)
+            os.replace(tmp_path, path + '.npz')
+        self.runs += 1
+        return result
+
+    def serve(self, poll=0.1, max_jobs=None, idle_timeout=None):
+        wd = tempfile.mkdtemp(prefix='contur_worker_', dir=self.application.scratch_dir)
+        idle_since = time.perf_counter()
+        try:
+            while max_jobs is None or self.runs < max_jobs:
+                job_id, claimed = self.claim()
+                if job_id is not None:
+                    self.run_job(job_id, claimed, wd)
+                    idle_since = time.perf_counter()
+                elif os.path.exists(os.path.join(self.spool_dir, 'stop')):
+                    break
+                elif idle_timeout is not None and time.perf_counter() - idle_since > idle_timeout:
+                    break
+                else:
+                    time.sleep(poll)
+        finally:
+            shutil.rmtree(wd, ignore_errors=True)
+        return self.runs
+
+
+def start_local_workers(spool_dir, workers=None, executable=None, timeout=None, poll=0.1):
+    # stand-in for a cluster: separate worker processes on this machine sharing the same spool directory
+    workers = os.cpu_count() if workers is None else workers
+    env = dict(os.environ)
+    package_parent = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env["PYTHONPATH"] = os.pathsep.join([package_parent, *([env["PYTHONPATH"]] if "PYTHONPATH" in env else [])])
+
+    cmd = [sys.executable, "-m", "conturpy.distributed", "worker", spool_dir, "--poll", str(poll)]
+    if executable is not None:
+        cmd += ["--executable", os.path.abspath(str(executable))]
+    if timeout is not None:
+        cmd += ["--timeout", str(timeout)]
+    return [subprocess.Popen(cmd, env=env) for _ in range(workers)]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m conturpy.distributed",
+                                     description="Run CONTUR jobs from a shared spool directory")
+    sub_parsers = parser.add_subparsers(dest="command", required=True)
+    worker_parser = sub_parsers.add_parser("worker", help="serve jobs until the coordinator sends stop")
+    worker_parser.add_argument("spool_dir")
+    worker_parser.add_argument("--executable", default=None)
+    worker_parser.add_argument("--timeout", type=float, default=0.5)
+    worker_parser.add_argument("--poll", type=float, default=0.1)
+    worker_parser.add_argument("--max-jobs", type=int, default=None)
+    worker_parser.add_argument("--idle-timeout", type=float, default=None)
+    args = parser.parse_args(argv)
+
+    application = ConturApplication(timeout=args.timeout, executable=args.executable)
+    worker = ConturSpoolWorker(args.spool_dir, application)
+    worker.serve(poll=args.poll, max_jobs=args.max_jobs, idle_timeout=args.idle_timeout)
+
+
+if __name__ == "__main__":
+    main()
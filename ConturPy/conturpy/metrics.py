@@ -0,0 +1,116 @@
+import functools
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+# collectors currently inside their `with` block; timings are only taken while this is non-empty
+_active = []
+
+
+def record(stage, elapsed):
+    for metrics in list(_active):
+        metrics.record(stage, elapsed)
+
+
+@contextmanager
+def timed(stage):
+    if not _active:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(stage, time.perf_counter() - start)
+
+
+class _Samples(list):
+    def record(self, stage, elapsed):
+        self.append((stage, elapsed))
+
+
+def _timing():
+    return bool(_active)
+
+
+def _in_worker(timing, fun, *args):
+    # run in a process pool worker: timings are taken only if the parent is timing, and are sent back with the
+    # result to be recorded there by _merged
+    samples = _Samples()
+    saved = _active[:]
+    _active[:] = [samples] if timing else []
+    try:
+        return fun(*args), samples
+    finally:
+        _active[:] = saved
+
+
+def _merged(result, samples):
+    for stage, elapsed in samples:
+        record(stage, elapsed)
+    return result
+
+
+def instrumented(stage):
+    def decorator(fun):
+        @functools.wraps(fun)
+        def wrapper(*args, **kwargs):
+            if not _active:
+                return fun(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return fun(*args, **kwargs)
+            finally:
+                record(stage, time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+
+class ConturMetrics(object):
+    def __init__(self, hooks=None):
+        self.hooks = [] if hooks is None else list(hooks)
+        self.stages = {}
+        self._lock = threading.Lock()
+
+    def add_hook(self, hook):
+        self.hooks.append(hook)
+
+    def record(self, stage, elapsed):
+        with self._lock:
+            count, total, min_time, max_time = self.stages.get(stage, [0, 0., float('inf'), 0.])
+            self.stages[stage] = [count + 1, total + elapsed, min(min_time, elapsed), max(max_time, elapsed)]
+        for hook in self.hooks:
+            try:
+                hook(stage, elapsed)
+            except Exception:
+                # a failing exporter must not abort the run being timed
+                logging.getLogger(__name__).exception(f"Metrics hook {hook!r} failed for stage '{stage}'")
+
+    def reset(self):
+        with self._lock:
+            self.stages = {}
+
+    def to_dict(self):
+        with self._lock:
+            return {stage: {"count": count, "total": total, "mean": total / count, "min": min_time, "max": max_time}
+                    for stage, (count, total, min_time, max_time) in self.stages.items()}
+
+    def to_json(self, **kwargs):
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def __enter__(self):
+        _active.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        _active.remove(self)
+
+    def __repr__(self):
+        stages = self.to_dict()
+        width = max([len(stage) for stage in stages] + [5])
+        header = f"{'stage':<{width}s} {'count':>8s} {'total [s]':>12s} {'mean [s]':>12s} {'max [s]':>12s}"
+        return "ConturMetrics:\n" + "\n".join([header] + [
+            f"{stage:<{width}s} {vals['count']:>8d} {vals['total']:>12.6f} {vals['mean']:>12.6f} {vals['max']:>12.6f}"
+            for stage, vals in sorted(stages.items(), key=lambda item: -item[1]['total'])])
@@ -0,0 +1,151 @@
+import numpy as np
+from .sweep import ConturSweep
+
+
+def _rbf(x1, x2, length_scale):
+    sq_dist = np.sum((x1[:, None, :] - x2[None, :, :]) ** 2, axis=-1)
+    return np.exp(-.5 * sq_dist / length_scale ** 2)
+
+
+class GaussianProcess(object):
+    # small isotropic RBF Gaussian process on the unit cube, length scale picked by marginal likelihood
+    def __init__(self, length_scales=np.geomspace(.05, 2., 16), noise=1e-6):
+        self.length_scales = length_scales
+        self.noise = noise
+
+    def fit(self, x, y):
+        self.x = x
+        self.y_mean = y.mean()
+        self.y_std = y.std() if y.std() > 0 else 1.
+        y_norm = (y - self.y_mean) / self.y_std
+
+        best = None
+        for length_scale in self.length_scales:
+            k = _rbf(x, x, length_scale) + self.noise * np.eye(len(x))
+            try:
+                chol = np.linalg.cholesky(k)
+            except np.linalg.LinAlgError:
+                continue
+            alpha = np.linalg.solve(chol.T, np.linalg.solve(chol, y_norm))
+            log_likelihood = -.5 * y_norm @ alpha - np.sum(np.log(np.diag(chol)))
+            if best is None or log_likelihood > best[0]:
+                best = (log_likelihood, length_scale, chol, alpha)
+
+        if best is None:
+            raise np.linalg.LinAlgError("Unable to fit surrogate: covariance matrix not positive definite")
+        _, self.length_scale, self._chol, self._alpha = best
+        return self
+
+    def predict(self, x):
+        k_star = _rbf(x, self.x, self.length_scale)
+        mean = k_star @ self._alpha
+        v = np.linalg.solve(self._chol, k_star.T)
+        var = np.clip(1. - np.sum(v ** 2, axis=0), 0., None)
+        return self.y_mean + self.y_std * mean, self.y_std * np.sqrt(var)
+
+
+def nozzle_length(r):
+    return r.nozzle_length
+
+
+class ConturOptimizer(object):
+    def __init__(self, bounds, base_settings=None, objective=nozzle_length, batch_size=4, kappa=2., candidates=4096,
+                 min_uncertainty=1e-3, seed=None):
+        # bounds: card label -> (low, high); the objective of a ConturResult is minimised, every other card keeps its
+        # value from base_settings (e.g. a fixed CMC for a fixed exit Mach number)
+        self.bounds = dict(bounds)
+        self.sweep = ConturSweep(self.bounds, base_settings)
+        self.objective = objective
+        self.batch_size = batch_size
+        self.kappa = kappa
+        self.candidates = candidates
+        self.min_uncertainty = min_uncertainty
+        self.rng = np.random.default_rng(seed)
+        self.seed = seed
+
+        self.labels = list(self.bounds)
+        self._low = np.array([self.bounds[label][0] for label in self.labels], dtype=float)
+        self._high = np.array([self.bounds[label][1] for label in self.labels], dtype=float)
+
+        self.x = np.zeros((0, len(self.labels)))
+        self.y = np.zeros((0,))
+        self.results = []
+        self.surrogate = None
+
+    def _to_unit(self, values):
+        return (values - self._low) / (self._high - self._low)
+
+    def _from_unit(self, unit):
+        return self._low + unit * (self._high - self._low)
+
+    def _evaluate(self, application, unit, workers, refine_amt):
+        values = self._from_unit(unit)
+        samples = {label: values[:, idx] for idx, label in enumerate(self.labels)}
+        res = self.sweep.evaluate(application, samples, outputs={"objective": self.objective}, workers=workers,
+                                  refine_amt=refine_amt)
+
+        self.x = np.vstack([self.x, unit])
+        self.y = np.concatenate([self.y, np.asarray(res["objective"], dtype=float)])
+        self.results.extend(res.results)
+
+    def _training_data(self):
+        finite = np.isfinite(self.y)
+        if not np.any(finite):
+            raise RuntimeError("No successful CONTUR evaluation to fit the surrogate on")
+        # failed decks stay in the training set at the worst value seen so the optimiser steers away from them
+        return self.x, np.where(finite, self.y, np.max(self.y[finite]))
+
+    def _select(self):
+        # batch lower confidence bound with the "kriging believer" heuristic: each pick is added to the surrogate at
+        # its predicted value, which collapses the uncertainty around it before the next pick
+        pool = self.rng.random((self.candidates, len(self.labels)))
+        x, y = self._training_data()
+        picks = []
+        for _ in range(self.batch_size):
+            gp = GaussianProcess().fit(x, y)
+            mean, std = gp.predict(pool)
+            lcb = mean - self.kappa * std
+            lcb[std < self.min_uncertainty * gp.y_std] = np.inf
+            if not np.any(np.isfinite(lcb)):
+                break
+            best = np.argmin(lcb)
+            picks.append(pool[best])
+            x = np.vstack([x, pool[best]])
+            y = np.append(y, mean[best])
+            pool = np.delete(pool, best, axis=0)
+        return np.array(picks)
+
+    def run(self, application, n_initial=8, iterations=10, workers=None, refine_amt=1):
+        from scipy.stats import qmc
+        if len(self.y) == 0:
+            self._evaluate(application, qmc.LatinHypercube(d=len(self.labels), seed=self.seed).random(n_initial),
+                           workers, refine_amt)
+
+        for _ in range(iterations):
+            picks = self._select()
+            if len(picks) == 0:
+                # the surrogate is certain everywhere: nothing left worth a CONTUR call
+                break
+            self._evaluate(application, picks, workers, refine_amt)
+
+        self.surrogate = GaussianProcess().fit(*self._training_data())
+        return self.best
+
+    @property
+    def best(self):
+        idx = np.nanargmin(self.y)
+        values = self._from_unit(self.x[idx])
+        return {**{label: values[jdx] for jdx, label in enumerate(self.labels)}, "objective": self.y[idx]}
+
+    def predict(self, **values):
+        unit = self._to_unit(np.array([[values[label] for label in self.labels]], dtype=float))
+        mean, std = self.surrogate.predict(unit)
+        return mean[0], std[0]
+
+    def history(self):
+        values = self._from_unit(self.x)
+        return {**{label: values[:, idx] for idx, label in enumerate(self.labels)}, "objective": self.y}
+
+    def __repr__(self):
+        best = "" if len(self.y) == 0 else "".join([f"{k:>15s}: {v:g}\n" for k, v in self.best.items()])
+        return f"ConturOptimizer:\n{len(self.y):15g} CONTUR evaluations\n" + best
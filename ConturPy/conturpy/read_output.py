@@ -1,29 +1,41 @@
+import glob
+import io
+import json
+import math
+import mmap
+import os
+import re
+import shutil
+import struct
+import sys
+import tempfile
+import threading
+import time
+import weakref
+import zipfile
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 import numpy as np
-from .create_report import save_all
+from .metrics import instrumented, timed, _in_worker, _merged, _timing
 
 
-def read_param(line, find_str, ntype=float):
-    numeric_vals = [".", "-", *[str(x) for x in range(10)]]
+# the value after "NAME=": leading blanks, then digits, signs, points and exponents ("+" after an exponent is dropped)
+_PARAM_VALUE = re.compile(r' *((?:[-.0-9]|[Ee](?=[-.0-9+])|(?<=[Ee])\+)*)')
 
-    substr = ''
-    idx = line.find(find_str) + len(find_str) - 1
-    search = True
-    while search and idx < len(line):
+
+def _scan_param(line, idx):
+    if 0 < idx < len(line) and line[idx] == '+' and line[idx - 1] in 'Ee':
         idx += 1
-        char = line[idx]
+    match = _PARAM_VALUE.match(line, idx)
+    if match.end() == len(line):
+        # the original character scanner ran off the end of lines without a trailing newline
+        raise IndexError("string index out of range")
+    return match.group(1).replace('+', '')
 
-        if len(substr) == 0 and char == ' ':
-            pass
-        elif char in numeric_vals:
-            substr += char
-        elif char in ['E', 'e'] and idx < len(line) - 1 and \
-                (line[idx + 1] in numeric_vals or line[idx + 1] == '+'):
-            substr += char
-        elif char == '+' and idx > 0 and line[idx - 1] in ['e', 'E']:
-            pass
-        else:
-            search = False
 
+def read_param(line, find_str, ntype=float):
+    substr = _scan_param(line, line.find(find_str) + len(find_str))
     if substr != '':
         return ntype(substr)
     else:
@@ -60,25 +72,51 @@ def read_array(in_lines):
         return None
 
 
-def _read_until_next_blank(line, idx):
-    res = ""
-    while idx >= 0 and (line[idx] != ' ' or (line[idx] == ' ' and res == "")):
-        char = line[idx]
-        res = char + res
-        idx -= 1
-    return res
-
-
 def get_params(line):
     param_list = []
-    for k in range(len(line) - 1, -1, -1):
-        char = line[k]
-        if char == '=' and k > 0:
-            find_str = _read_until_next_blank(line, k - 1) + '='
-            param_list.append((find_str[:-1].strip(), read_param(line, find_str, ntype=float)))
+    k = line.rfind('=')
+    while k > 0:
+        # the name runs back to the previous blank, allowing a single blank before the "="
+        name_end = k - 1 if line[k - 1] == ' ' else k
+        find_str = line[line.rfind(' ', 0, name_end) + 1:k + 1]
+        substr = _scan_param(line, line.find(find_str) + len(find_str))
+        param_list.append((find_str[:-1].strip(), float(substr) if substr != '' else None))
+        k = line.rfind('=', 0, k)
     return param_list
 
 
+def section_params(raw, table_idx):
+    # parameter groups of a section: a ("Table n",) marker where each table starts, then every other line with a "="
+    parameters = []
+    next_table = 1
+    for idx, line in enumerate(raw):
+        this_table = table_idx[idx]
+        if this_table != 0:
+            if idx == 0:
+                parameters.append([(f"Table {this_table:.0f}",)])
+            elif idx > 0 and this_table == next_table:
+                parameters.append([(f"Table {this_table:.0f}",)])
+                next_table += 1
+        elif '=' in line:
+            possible_param = get_params(line)
+            if len(possible_param) > 0:
+                parameters.append(possible_param)
+    return parameters
+
+
+def _byte_table(chars):
+    table = np.zeros(256, dtype=bool)
+    table[np.frombuffer(chars, dtype=np.uint8)] = True
+    return table
+
+
+# bytes of a line of plain numbers, of anything else float() may accept ("nan", "inf", "1_000", whitespace, ...) and
+# of the blanks between table columns ("\0" separates the lines of a section)
+_NUMERIC_BYTES = _byte_table(b' 0123456789.+-Ee\n\0')
+_FLOAT_BYTES = _byte_table(b' 0123456789.+-Ee\n\0NnAaIiFfTtYy_\t\x0b\x0c\r\x1c\x1d\x1e\x1f' + bytes(range(128, 256)))
+_BLANK_BYTES = _byte_table(b' \n\0')
+
+
 def read_table_line(line):
     if len(line.strip()) < 1:
         return None
@@ -93,8 +131,67 @@ def read_table_line(line):
     return np.array(table_line)
 
 
-def identify_tables(lines):
+def _decode_lines(lines):
+    # width of every line that reads as a row of numbers (None otherwise) and the values of those rows, worked out for
+    # the whole section at once on its bytes. Lines of plain numbers are split and converted together; lines that
+    # may hold something else float() accepts (nan, inf, tabs, ...) go through read_table_line
+    raw = np.frombuffer("\0".join(lines).encode(), dtype=np.uint8)
+
+    # same splitting of glued negatives as read_table_line: a blank between a digit and a minus sign
+    glued = np.flatnonzero((raw[1:] == ord('-')) & (raw[:-1] >= ord('0')) & (raw[:-1] <= ord('9'))) + 1
+    raw = np.insert(raw, glued, ord(' '))
+
+    ends = np.flatnonzero(raw == 0)
+    if len(ends) != len(lines) - 1:
+        return _decode_lines_slow(lines)
+
+    numeric = np.ones(len(lines), dtype=bool)
+    numeric[np.searchsorted(ends, np.flatnonzero(~_NUMERIC_BYTES[raw]))] = False
+    maybe_float = np.ones(len(lines), dtype=bool)
+    maybe_float[np.searchsorted(ends, np.flatnonzero(~_FLOAT_BYTES[raw]))] = False
+
+    blank = _BLANK_BYTES[raw]
+    starts = np.flatnonzero(~blank & np.concatenate([[True], blank[:-1]]))
+    counts = np.bincount(np.searchsorted(ends, starts), minlength=len(lines)) * numeric
+
+    # blank out every other line and split what is left in one go
+    keep = np.repeat(numeric, np.diff(np.concatenate([[-1], ends, [len(raw) - 1]])))
+    keep[ends] = False
+    tokens = np.where(keep, raw, ord(' ')).tobytes().decode().split()
+    try:
+        values = np.array(tokens, dtype=float)
+    except ValueError:
+        return _decode_lines_slow(lines)
+
+    widths = [width if width > 0 else None for width in counts.tolist()]
+    slow_rows = {}
+    for idx in np.flatnonzero(~numeric & maybe_float):
+        table_line = read_table_line(lines[idx])
+        widths[idx] = None if table_line is None else len(table_line)
+        if table_line is not None:
+            slow_rows[idx] = table_line
+    offsets = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    return widths, (values, offsets, slow_rows)
+
+
+def _decode_lines_slow(lines):
     table_lines = [read_table_line(line) for line in lines]
+    widths = [None if table_line is None else len(table_line) for table_line in table_lines]
+    slow_rows = {idx: table_line for idx, table_line in enumerate(table_lines) if table_line is not None}
+    return widths, (np.zeros(0), np.zeros(len(lines), dtype=int), slow_rows)
+
+
+def _decode_rows(rows, width, decoded):
+    values, offsets, slow_rows = decoded
+    if any(idx in slow_rows for idx in rows):
+        return np.vstack([slow_rows[idx] if idx in slow_rows else values[offsets[idx]:offsets[idx] + width]
+                          for idx in rows])
+    # gathered column by column, so the transposed block is already in the column-major layout ConturTable keeps
+    return values[np.arange(width)[:, None] + offsets[rows][None, :]].T
+
+
+def identify_tables(lines):
+    table_lines, decoded = _decode_lines(lines)
     table_idx = np.zeros((len(lines),))
 
     line1 = table_lines[0]
@@ -106,7 +203,7 @@ def identify_tables(lines):
         table_idx[0] = 1
 
         if line2 is not None:
-            if len(line1) == len(line2):
+            if line1 == line2:
                 table_idx[1] = 1
                 num_tables = 1
             else:
@@ -123,13 +220,13 @@ def identify_tables(lines):
     for kdx, line3 in enumerate(table_lines[2:]):
         idx = kdx + 2
         if line2 is not None and line3 is not None:
-            if len(line2) == len(line3):
+            if line2 == line3:
                 table_idx[idx] = table_idx[idx - 1]
             else:
                 num_tables += 1
                 table_idx[idx] = num_tables
         elif line1 is not None and line3 is not None:
-            if len(line1) == len(line3):
+            if line1 == line3:
                 table_idx[idx] = table_idx[idx - 2]
             else:
                 pass
@@ -150,15 +247,28 @@ def identify_tables(lines):
             middle_ends = changes[1::2].flatten() + 1
             text_slices = np.array([[0, *middle_ends], [*middle_ends, len(template_line)]]).T
             header = [lines[start_idx - 2][text_slice[0]:text_slice[1]].strip() for text_slice in text_slices]
-            table = np.vstack([table_line for idx, table_line in enumerate(table_lines) if
-                               table_idx[idx] == table_num and table_line is not None])
+            rows = np.array([idx for idx in np.flatnonzero(table_idx == table_num) if table_lines[idx] is not None])
+            widths = {table_lines[idx] for idx in rows}
+            if len(widths) > 1:
+                raise ValueError("all the input array dimensions must match to stack table rows")
+            table = _decode_rows(rows, widths.pop(), decoded)
         tables.append((header, table))
     return tables, table_idx
 
 
+# characters of a header that cannot go into a column name, and what they become (anything else becomes "_")
+_HEADER_CHARS = re.compile(r'[^A-Za-z0-9]')
+_HEADER_REPLACEMENTS = {".": "_", "*": "star_", "/": "_over_", "+": "_plus_"}
+
+
 class ConturTable(object):
+    # a single 2-D array, column-major when it comes from the parser so that every column (table.X_IN, table.Mach,
+    # ...) is a contiguous view; columns are looked up by name instead of being stored as attributes
+    __slots__ = ("data", "headers", "_columns")
+
     def __init__(self, data, headers=None):
-        self.data = data
+        self.data = np.asfortranarray(data) if np.ndim(data) == 2 else data
+        self._columns = {}
 
         if headers is not None:
             if len(self.data) == 0:
@@ -173,8 +283,28 @@ class ConturTable(object):
             else:
                 self.headers = self.clean_headers(headers)
 
-            for idx, header in enumerate(self.headers):
-                setattr(self, header, self.data[:, idx])
+            self._columns = {header: idx for idx, header in enumerate(self.headers)}
+
+    def __getattr__(self, name):
+        try:
+            idx = object.__getattribute__(self, '_columns')[name]
+        except (AttributeError, KeyError):
+            raise AttributeError(f"'ConturTable' object has no attribute '{name}'") from None
+        return self.data[:, idx]
+
+    def __dir__(self):
+        return [*super().__dir__(), *self._columns]
+
+    def __getstate__(self):
+        return {"data": self.data, "headers": getattr(self, 'headers', None)}
+
+    def __setstate__(self, state):
+        # also accepts the attribute dict of tables pickled before ConturTable had slots
+        self.data = state["data"]
+        self._columns = {}
+        if state.get("headers") is not None:
+            self.headers = state["headers"]
+            self._columns = {header: idx for idx, header in enumerate(self.headers)}
 
     def __repr__(self):
         row_min = [max(12, len(header) + 2) for header in self.headers]
@@ -195,6 +325,13 @@ class ConturTable(object):
 
         return "ConturTable(" + header_print + '\n' + data_print + ")"
 
+    @classmethod
+    def _restore(cls, data, headers):
+        # headers that were already cleaned, e.g. from ConturResult.load
+        table = cls.__new__(cls)
+        table.__setstate__({"data": data, "headers": headers})
+        return table
+
     def to_numpy(self):
         return self.data
 
@@ -205,37 +342,21 @@ class ConturTable(object):
     @staticmethod
     def clean_headers(headers):
         clean_headers = []
-        # noinspection SpellCheckingInspection
-        allowable_first_chars = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
-        allowable_next_chars = allowable_first_chars + "0123456789"
-        not_allowed_ends = ["_"]
-
-        special_replace_dict = {"MACH NO.": "Mach"}
-        replace_dict = {".": "_", "*": "star_", "/": "_over_", "+": "_plus_"}
-
         count_unnamed = 0
 
         for header in headers:
-            for key in special_replace_dict:
-                header = header.replace(key, special_replace_dict[key])
+            header = header.replace("MACH NO.", "Mach")
 
             if len(header) > 0:
-                clean_header = header[0] if header[0] in allowable_first_chars else "_"
+                clean_header = header[0] if header[0].isascii() and header[0].isalpha() else "_"
+                clean_header += _HEADER_CHARS.sub(lambda m: _HEADER_REPLACEMENTS.get(m.group(), '_'), header[1:])
             else:
                 clean_header = f"Untitled{count_unnamed}"
                 count_unnamed += 1
 
-            if len(header) > 1:
-                for char in header[1:]:
-                    if char in allowable_next_chars:
-                        clean_header += char
-                    elif char in replace_dict:
-                        clean_header += replace_dict[char]
-                    else:
-                        clean_header += '_'
-
-            while clean_header[-1] in not_allowed_ends:
-                clean_header = clean_header[:-1]
+            clean_header = clean_header.rstrip('_')
+            if len(clean_header) == 0:
+                raise IndexError(f"Table header {header!r} has no usable characters")
 
             if clean_header == 'POI':
                 clean_header = 'POINT'
@@ -246,14 +367,10 @@ class ConturTable(object):
 
             clean_headers.append(clean_header)
 
+        counts = Counter(headers)
         for idx in range(len(headers)):
-            header = headers[idx]
-
-            same_msk = np.array([x == header for x in headers])
-            if np.sum(same_msk) > 1:
-                for kdx in range(len(same_msk)):
-                    if same_msk[kdx]:
-                        headers[kdx] = ""
+            if counts[headers[idx]] > 1:
+                headers[idx] = ""
 
         for idx in range(len(headers)):
             header = headers[idx]
@@ -264,7 +381,7 @@ class ConturTable(object):
         return clean_headers
 
 
-def dispatch_section(section, name):
+def section_parser(title_line, name):
     parsers = {
         'NOZZLE CONTOUR': parse_nozzle_contour,
         'UPSTREAM CONTOUR': parse_upstream_contour,
@@ -277,7 +394,7 @@ def dispatch_section(section, name):
         'COORDINATES AND DERIVATIVES': parse_coordinates_and_derivatives}
     parser_list = [key for key in parsers]
 
-    section_title = section[0].replace(name, '').strip()
+    section_title = title_line.replace(name, '').strip()
     matching_keys = np.array([key in section_title for key in parser_list])
     num_matches = np.sum(matching_keys)
 
@@ -285,12 +402,20 @@ def dispatch_section(section, name):
         raise NotImplementedError
     elif num_matches == 1:
         matching_name = parser_list[np.argwhere(matching_keys)[0][0]]
-        return parsers[matching_name](section)
+        parser = parsers[matching_name]
     elif "FROM THROAT CHARACTERISTIC" in section_title and "INVISCID CONTOUR" in section_title:
-        return parse_inviscid_contour(section)
+        parser = parse_inviscid_contour
     else:
         raise Exception("Multiple matches: parsing ambiguous")
 
+    return parser
+
+
+def dispatch_section(section, name):
+    parser = section_parser(section[0], name)
+    with timed(parser.__name__):
+        return parser(section)
+
 
 class BaseConturOutput(object):
     def __init__(self, raw, parameters=None, tables=None):
@@ -309,21 +434,7 @@ class BaseConturOutput(object):
 class ConturOutput(BaseConturOutput):
     def __init__(self, raw, class_name):
         tables, table_idx = identify_tables(raw)
-        parameters = []
-
-        next_table = 1
-        for idx, line in enumerate(raw):
-            this_table = table_idx[idx]
-            if this_table != 0:
-                if idx == 0:
-                    parameters.append([(f"Table {this_table:.0f}",)])
-                elif idx > 0 and this_table == next_table:
-                    parameters.append([(f"Table {this_table:.0f}",)])
-                    next_table += 1
-            if this_table == 0:
-                possible_param = get_params(line)
-                if len(possible_param) > 0:
-                    parameters.append(possible_param)
+        parameters = section_params(raw, table_idx)
 
         tables = [ConturTable(data, header) for header, data in tables]
 
@@ -334,21 +445,7 @@ class ConturOutput(BaseConturOutput):
 class ConturUpstreamContour(BaseConturOutput):
     def __init__(self, raw):
         tables, table_idx = identify_tables(raw)
-        parameters = []
-
-        next_table = 1
-        for idx, line in enumerate(raw):
-            this_table = table_idx[idx]
-            if this_table != 0:
-                if idx == 0:
-                    parameters.append([(f"Table {this_table:.0f}",)])
-                elif idx > 0 and this_table == next_table:
-                    parameters.append([(f"Table {this_table:.0f}",)])
-                    next_table += 1
-            if this_table == 0:
-                possible_param = get_params(line)
-                if len(possible_param) > 0:
-                    parameters.append(possible_param)
+        parameters = section_params(raw, table_idx)
 
         tables = [ConturTable(tables[0][1], ["POINT", *tables[0][0][1:5], "POINT1"])]
 
@@ -359,21 +456,7 @@ class ConturUpstreamContour(BaseConturOutput):
 class ConturInviscidContour(BaseConturOutput):
     def __init__(self, raw):
         tables, table_idx = identify_tables(raw)
-        parameters = []
-
-        next_table = 1
-        for idx, line in enumerate(raw):
-            this_table = table_idx[idx]
-            if this_table != 0:
-                if idx == 0:
-                    parameters.append([(f"Table {this_table:.0f}",)])
-                elif idx > 0 and this_table == next_table:
-                    parameters.append([(f"Table {this_table:.0f}",)])
-                    next_table += 1
-            if this_table == 0:
-                possible_param = get_params(line)
-                if len(possible_param) > 0:
-                    parameters.append(possible_param)
+        parameters = section_params(raw, table_idx)
 
         fixed_tables = []
         for table_num, table in enumerate(tables):
@@ -404,21 +487,7 @@ class ConturInviscidContour(BaseConturOutput):
 class ConturBoundaryLayerCalculations(BaseConturOutput):
     def __init__(self, raw):
         tables, table_idx = identify_tables(raw)
-        parameters = []
-
-        next_table = 1
-        for idx, line in enumerate(raw):
-            this_table = table_idx[idx]
-            if this_table != 0:
-                if idx == 0:
-                    parameters.append([(f"Table {this_table:.0f}",)])
-                elif idx > 0 and this_table == next_table:
-                    parameters.append([(f"Table {this_table:.0f}",)])
-                    next_table += 1
-            if this_table == 0:
-                possible_param = get_params(line)
-                if len(possible_param) > 0:
-                    parameters.append(possible_param)
+        parameters = section_params(raw, table_idx)
 
         data_arr = tables[0][1]
         header_arr = tables[0][0]
@@ -515,6 +584,11 @@ def parse_coordinates_and_derivatives(section):
     return ConturOutput(section, "ConturCoordinatesAndDerivatives")
 
 
+characteristic_parsers = (parse_intermediate_right_characteristic, parse_intermediate_left_characteristic,
+                          parse_throat_characteristic)
+contour_parsers = (parse_nozzle_contour, parse_upstream_contour, parse_inviscid_contour)
+
+
 def post_process(contur_results):
     coords = [x for x in contur_results if x.class_name == "ConturCoordinatesAndDerivatives"]
 
@@ -550,124 +624,788 @@ def get_project_slices(lines, title):
     return np.vstack([section_slices, [*section_slices[1:], len(lines)]]).T
 
 
-class ConturResult(object):
-    def __init__(self, filename, refine_amt=21):
-        with open(filename, 'r') as in_file:
-            self.raw = in_file.readlines()
+def _decode_text(data):
+    # same decoding and newline handling as reading the file in text mode
+    return io.TextIOWrapper(io.BytesIO(data)).readlines()
 
-        self.title = get_project_title(self.raw)
-        section_slices = get_project_slices(self.raw, self.title)
 
+class ConturSectionReader(object):
+    # memory-maps a CONTUR output and finds its sections by scanning for the title bytes; a section is only copied
+    # out of the map and decoded when its lines are asked for
+    def __init__(self, filename):
+        self.filename = filename
+        self._file = open(filename, 'rb')
+        try:
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # empty files cannot be mapped
+            self._data = b''
+        self.title = get_project_title(self._decode(0, self._line_end(0)))
+        self.slices = self._find_sections()
+
+    def _line_end(self, start):
+        end = self._data.find(b'\n', start)
+        return len(self._data) if end == -1 else end + 1
+
+    def _decode(self, start, stop):
+        return _decode_text(self._data[start:stop])
+
+    def _find_sections(self):
+        title = self.title.encode()
+        starts = []
+        idx = self._data.find(title)
+        while idx != -1 and idx < len(self._data):
+            line_start = self._data.rfind(b'\n', 0, idx) + 1
+            if not starts or starts[-1] != line_start:
+                starts.append(line_start)
+            idx = self._data.find(title, self._line_end(idx))
+        return np.vstack([starts, [*starts[1:], len(self._data)]]).T
+
+    def __len__(self):
+        return len(self.slices)
+
+    @property
+    def num_lines(self):
+        chunk = 1 << 24
+        num_lines = sum(self._data[idx:idx + chunk].count(b'\n') for idx in range(0, len(self._data), chunk))
+        return num_lines + (len(self._data) > 0 and self._data[-1:] != b'\n')
+
+    def title_line(self, idx):
+        start = self.slices[idx][0]
+        return self._decode(start, self._line_end(start))[0]
+
+    def lines(self, idx=None):
+        if idx is None:
+            return self._decode(0, len(self._data))
+        start, stop = self.slices[idx]
+        return self._decode(start, stop)
+
+    def parse(self, idx):
+        return dispatch_section(self.lines(idx), self.title)
+
+    def __iter__(self):
+        # one parsed section at a time, so that memory stays flat however large the output
+        for idx in range(len(self)):
+            yield self.parse(idx)
+
+    def close(self):
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __repr__(self):
+        return f"ConturSectionReader:\n{len(self._data):15g} bytes\n{len(self):15g} output sections"
+
+
+class ConturTailReader(object):
+    # follows an output file that CONTUR is still writing: a section is complete, and gets parsed, once the title line
+    # of the next one has been written; the last section is only complete when the run has finished
+    def __init__(self, filename):
+        self.filename = filename
+        self.title = None
         self.sections = []
-        for idx, sec in enumerate(section_slices):
+        self.num_lines = 0
+        self.last_update = time.perf_counter()
+        self._file = None
+        self._pending = b''
+        self._lines = []
+
+    def _read(self):
+        if self._file is None:
             try:
-                self.sections.append(dispatch_section(self.raw[sec[0]:sec[1]], self.title))
+                self._file = open(self.filename, 'rb')
+            except FileNotFoundError:
+                return []
+        data = self._file.read()
+        if data:
+            self.last_update = time.perf_counter()
+        # only whole lines are decoded, the rest waits for the next read
+        data = self._pending + data
+        end = data.rfind(b'\n') + 1
+        self._pending = data[end:]
+        return _decode_text(data[:end])
+
+    def _parse(self, lines):
+        try:
+            section = dispatch_section(lines, self.title)
+        except (IndexError, AttributeError):
+            import warnings
+            warnings.warn(f"Unable to parse {self.title}")
+            return None
+        self.sections.append(section)
+        return section
+
+    def poll(self):
+        # the sections completed since the last call
+        completed = []
+        for line in self._read():
+            self.num_lines += 1
+            if self.title is None:
+                self.title = get_project_title([line])
+            if self.title in line:
+                if self._lines:
+                    completed.append(self._parse(self._lines))
+                self._lines = [line]
+            elif self._lines:
+                self._lines.append(line)
+        return [x for x in completed if x is not None]
+
+    def flush(self):
+        # the run has finished: whatever is left, including an unterminated last line, is the final section
+        completed = self.poll()
+        if self._pending:
+            line = _decode_text(self._pending)[0]
+            self._pending = b''
+            self.num_lines += 1
+            if self._lines:
+                self._lines.append(line)
+        if self._lines:
+            completed.append(self._parse(self._lines))
+            self._lines = []
+        return [x for x in completed if x is not None]
+
+    def follow(self, done, poll=0.5, idle_timeout=None):
+        # yields parsed sections as they are written until done() is true, e.g. lambda: process.poll() is not None;
+        # raises TimeoutError if the file has not grown for idle_timeout seconds while the run is still going
+        while True:
+            finished = done()
+            yield from self.flush() if finished else self.poll()
+            if finished:
+                return
+            if idle_timeout is not None and time.perf_counter() - self.last_update > idle_timeout:
+                raise TimeoutError(f"{self.filename} has not grown for {idle_timeout:g} s")
+            time.sleep(poll)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __repr__(self):
+        return f"ConturTailReader:\n{self.num_lines:15g} lines read\n{len(self.sections):15g} output sections"
+
+
+# memory maps made by _map_file that are still alive, see there
+_mappings = {"open": 0}
+_mappings_lock = threading.Lock()
+
+
+def _unmapped():
+    with _mappings_lock:
+        _mappings["open"] -= 1
+
+
+def _map_file(filename):
+    # a copy-on-write map of the whole file, or None if it should be read into memory instead. From Python 3.13 a map
+    # keeps no file descriptor open; before that each one holds a descriptor, so files are only mapped while maps use
+    # less than half of the descriptor limit, however many results are loaded
+    with open(filename, 'rb') as in_file:
+        if sys.version_info >= (3, 13):
+            return mmap.mmap(in_file.fileno(), 0, access=mmap.ACCESS_COPY, trackfd=False)
+        try:
+            import resource
+            limit = resource.getrlimit(resource.RLIMIT_NOFILE)[0]
+        except ImportError:
+            # Windows maps hold a handle, not a C runtime file descriptor
+            limit = resource = None
+        with _mappings_lock:
+            if resource is not None and limit != resource.RLIM_INFINITY and _mappings["open"] >= limit // 2:
+                return None
+            _mappings["open"] += 1
+        try:
+            mapped = mmap.mmap(in_file.fileno(), 0, access=mmap.ACCESS_COPY)
+        except (OSError, ValueError):
+            _unmapped()
+            return None
+    weakref.finalize(mapped, _unmapped)
+    return mapped
+
+
+def _memmap_npz(filename):
+    # arrays of an uncompressed .npz as views of one map of the archive; compressed archives, and archives that
+    # _map_file does not map, are read into memory
+    with zipfile.ZipFile(filename) as archive:
+        members = archive.infolist()
+    compressed = any(info.compress_type != zipfile.ZIP_STORED for info in members)
+    mapped = None if compressed else _map_file(filename)
+    if mapped is None:
+        with np.load(filename) as npz:
+            return {name: npz[name] for name in npz.files}
+
+    arrays = {}
+    for info in members:
+        local_header = struct.unpack('<4s5H3L2H', mapped[info.header_offset:info.header_offset + 30])
+        mapped.seek(info.header_offset + 30 + local_header[9] + local_header[10])
+        version = np.lib.format.read_magic(mapped)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(mapped)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(mapped)
+        name = info.filename[:-4] if info.filename.endswith('.npy') else info.filename
+        if int(np.prod(shape)) == 0:
+            arrays[name] = np.empty(shape, dtype=dtype)
+        else:
+            arrays[name] = np.ndarray(shape, dtype=dtype, buffer=mapped, offset=mapped.tell(),
+                                      order='F' if fortran_order else 'C')
+    return arrays
+
+
+# attributes of a lazy ConturResult and the method that computes each one on first access
+_lazy_attributes = {
+    "_coordinate_section": "_load_coordinate_section",
+    "sections": "_load_sections",
+    "nozzle_length": "_load_nozzle_length",
+    "characteristics": "_load_characteristics",
+    "contours": "_load_contours",
+    "bl_calculations": "_load_bl_calculations",
+    "characteristic_tables": "_load_characteristic_tables",
+    "design_mach": "_load_design_mach",
+    "contour_tables": "_load_contour_tables",
+    "bl_tables": "_load_bl_tables",
+    "_coordinates": "_load_wall_table",
+    "coordinates": "_load_coordinates",
+}
+
+
+def _load_result(filename, refine_amt=21, lazy=False):
+    # run in the worker processes of ConturResult.load_many: a file that cannot be parsed becomes a ConturFailure
+    from .run_contur import ConturFailure
+    try:
+        return ConturResult(filename, refine_amt=refine_amt, lazy=lazy)
+    except Exception as err:
+        return ConturFailure(filename, "parse", err)
+
+
+def _load_mapped(filenames, refine_amt=21, scratch_dir=None):
+    # run in the worker processes of ConturResult.load_many(transport="mmap"): the packed tables of a whole chunk of
+    # outputs go into one file in scratch_dir, and only its name and each result's offset, size and small metadata go
+    # back through the pipe
+    from .run_contur import ConturFailure
+    blocks = []
+    handles = []
+    offset = 0
+    for filename in filenames:
+        result = _load_result(filename, refine_amt)
+        if isinstance(result, ConturFailure):
+            handles.append(result)
+            continue
+        try:
+            data, metadata = result._pack()
+        except Exception as err:
+            handles.append(ConturFailure(filename, "parse", err))
+            continue
+        blocks.append(data)
+        handles.append((offset, data.size, metadata))
+        offset += data.size
+    if offset == 0:
+        # an empty file cannot be mapped
+        return None, handles
+    fd, mapped = tempfile.mkstemp(suffix=".npz", dir=scratch_dir)
+    with os.fdopen(fd, 'wb') as out_file:
+        np.savez(out_file, data=np.concatenate(blocks))
+    return mapped, handles
+
+
+def _from_mapped(mapped, handles):
+    # the tables of every result in the chunk are views of one map of its file, which outlives the file name; where a
+    # mapped file cannot be removed (Windows) it stays in scratch_dir until load_many removes the directory
+    from .run_contur import ConturFailure
+    data = np.zeros(0) if mapped is None else _memmap_npz(mapped)["data"]
+    results = [x if isinstance(x, ConturFailure) else ConturResult._unpack(data[x[0]:x[0] + x[1]], x[2])
+               for x in handles]
+    if mapped is not None:
+        try:
+            os.remove(mapped)
+        except OSError:
+            pass
+    return results
+
+
+class ConturDataset(object):
+    # the tables of many runs stacked by section type and header layout, each row tagged with the index of its run
+    # in summary and of its section in that run; summary holds one row of scalars per run
+    def __init__(self, results, sources):
+        from .run_contur import ConturFailure
+        self.results = results
+        success = np.array([not isinstance(r, ConturFailure) for r in results], dtype=bool)
+        self.summary = {
+            "run_id": np.arange(len(results)),
+            "filename": np.array([str(source) for source in sources]),
+            "success": success,
+            "failure": np.array([r.reason if isinstance(r, ConturFailure) else "" for r in results]),
+            "title": np.array([r.title if ok else "" for r, ok in zip(results, success)]),
+            "nozzle_length": np.array([np.nan if not ok or r.nozzle_length is None else r.nozzle_length
+                                       for r, ok in zip(results, success)], dtype=float),
+            "design_mach": np.array([np.nan if not ok or r.design_mach is None else r.design_mach
+                                     for r, ok in zip(results, success)], dtype=float),
+        }
+
+        layouts = {}
+        blocks = {}
+        names = {}
+        for run_id, r in enumerate(results):
+            if not success[run_id]:
+                continue
+            for section_idx, section in enumerate(r.sections):
+                for table in section.tables if isinstance(section.tables, list) else [section.tables]:
+                    headers = tuple(getattr(table, 'headers', ()))
+                    if len(headers) == 0 or table.data.ndim != 2 or len(table.data) == 0:
+                        continue
+                    key = (section.class_name, headers)
+                    if key not in layouts:
+                        # further layouts of a section type get a numbered name, e.g. ConturInviscidContour1
+                        count = names.get(section.class_name, 0)
+                        names[section.class_name] = count + 1
+                        layouts[key] = section.class_name if count == 0 else f"{section.class_name}{count}"
+                        blocks[layouts[key]] = (headers, [])
+                    tag = np.broadcast_to([[run_id, section_idx]], (len(table.data), 2))
+                    blocks[layouts[key]][1].append(np.hstack([tag, table.data]))
+
+        self.tables = {name: ConturTable._restore(np.asfortranarray(np.vstack(data)), ["run_id", "section", *headers])
+                       for name, (headers, data) in blocks.items()}
+
+    def __getitem__(self, name):
+        return self.tables[name]
+
+    def __len__(self):
+        return len(self.results)
+
+    def summary_pandas(self):
+        import pandas as pd
+        return pd.DataFrame(self.summary)
+
+    def to_pandas(self, name):
+        return self.tables[name].to_pandas()
+
+    def __repr__(self):
+        return f"ConturDataset:\n" \
+               f"{len(self):15g} runs\n" \
+               f"{int(np.sum(self.summary['success'])):15g} successful\n" + \
+               "".join([f"{len(table.data):15g} rows of {name}\n" for name, table in self.tables.items()])
+
+
+# ... and those of a streamed one, which keeps no copy of the lines
+_stream_attributes = {
+    "raw": "_load_raw",
+    "_reader": "_load_reader",
+}
+
+
+class ConturResult(object):
+    @instrumented("ConturResult")
+    def __init__(self, filename, refine_amt=21, lazy=False, stream=False, keep_raw=False):
+        self.filename = filename
+        self._keep_raw = keep_raw
+        if stream:
+            # the lines stay in the memory-mapped file; only the sections that get parsed are decoded
+            self._reader = ConturSectionReader(filename)
+        else:
+            with open(filename, 'r') as in_file:
+                self.raw = in_file.readlines()
+        self._index(refine_amt)
+        if not lazy:
+            self._parse()
+
+    @classmethod
+    @instrumented("ConturResult")
+    def from_text(cls, text, refine_amt=21, filename=None, lazy=False, keep_raw=False):
+        result = cls.__new__(cls)
+        result.filename = filename
+        result._keep_raw = keep_raw
+        result.raw = text.splitlines(keepends=True)
+        result._index(refine_amt)
+        if not lazy:
+            result._parse()
+        return result
+
+    @classmethod
+    def load_many(cls, paths, workers=None, refine_amt=21, lazy=False, combine=False, return_failures=False,
+                  transport="pickle", scratch_dir=None):
+        # paths is a list of output files or a glob pattern; files are parsed in a process pool of `workers` processes
+        # transport="mmap" writes the tables of each result to a file in scratch_dir instead of pickling them, the
+        # tables are then views of the mapped files and never go through the pipe; lazy is ignored, the text is not
+        # kept
+        if transport not in ("pickle", "mmap"):
+            raise ValueError(f"Unknown transport '{transport}': use 'pickle' or 'mmap'")
+        from .run_contur import ConturFailure
+        paths = sorted(glob.glob(paths)) if isinstance(paths, (str, os.PathLike)) else list(paths)
+        workers = os.cpu_count() if workers is None else workers
+        if workers > 1 and len(paths) > 1:
+            # a few chunks per worker keep the pool busy without sending each file name on its own
+            chunksize = max(1, len(paths) // (4 * workers))
+            mapped_dir = tempfile.mkdtemp(prefix='contur_results_', dir=scratch_dir) if transport == "mmap" else None
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    # parse timings taken in the workers are recorded here
+                    timing = _timing()
+                    if mapped_dir is not None:
+                        # one mapped file per chunk, not per result, keeps the number of open maps small
+                        chunks = [paths[idx:idx + chunksize] for idx in range(0, len(paths), chunksize)]
+                        results = [result for x in executor.map(_in_worker, repeat(timing), repeat(_load_mapped),
+                                                                chunks, repeat(refine_amt), repeat(mapped_dir))
+                                   for result in _from_mapped(*_merged(*x))]
+                    else:
+                        results = [_merged(*x) for x in executor.map(_in_worker, repeat(timing), repeat(_load_result),
+                                                                     paths, repeat(refine_amt), repeat(lazy),
+                                                                     chunksize=chunksize)]
+            finally:
+                if mapped_dir is not None:
+                    # after the pool has shut down: the directory, and the files of any results that were not unpacked
+                    # because a worker or _from_mapped raised
+                    shutil.rmtree(mapped_dir, ignore_errors=True)
+        else:
+            results = [_load_result(path, refine_amt, lazy) for path in paths]
+
+        if combine:
+            return ConturDataset(results, paths)
+
+        if return_failures:
+            return results
+        failures = [x for x in results if isinstance(x, ConturFailure)]
+        if failures:
+            import warnings
+            warnings.warn(f"{len(failures)} of {len(results)} CONTUR outputs could not be read: " +
+                          ", ".join([f"{x.source} ({x.reason})" for x in failures]))
+        return [x for x in results if not isinstance(x, ConturFailure)]
+
+    def _index(self, refine_amt):
+        self.refine_amt = refine_amt
+        self._streamed = 'raw' not in self.__dict__
+        if self._streamed:
+            self.title = self._reader.title
+            self._section_slices = self._reader.slices
+            title_lines = [self._reader.title_line(idx) for idx in range(len(self._reader))]
+        else:
+            self._num_lines = len(self.raw)
+            self.title = get_project_title(self.raw)
+            self._section_slices = get_project_slices(self.raw, self.title)
+            title_lines = [self.raw[start] for start, _ in self._section_slices]
+        self._section_parsers = [section_parser(title_line, self.title) for title_line in title_lines]
+        self._parsed_sections = {}
+
+    def _parse(self):
+        for name in _lazy_attributes:
+            getattr(self, name)
+
+    def __getattr__(self, name):
+        # only called for attributes that are not set yet: parse what they need, then keep the value
+        loaders = {**_lazy_attributes, **_stream_attributes}
+        if name not in loaders or '_parsed_sections' not in self.__dict__:
+            raise AttributeError(f"'ConturResult' object has no attribute '{name}'")
+        value = getattr(self, loaders[name])()
+        if name == 'raw' and not self.__dict__.get('_keep_raw', True):
+            # the text was dropped to save memory, it is handed out without being kept again
+            return value
+        if name not in self.__dict__:
+            setattr(self, name, value)
+        return self.__dict__[name]
+
+    def _section(self, idx):
+        if idx not in self._parsed_sections:
+            start, stop = self._section_slices[idx]
+            parser = self._section_parsers[idx]
+            try:
+                lines = self._reader.lines(idx) if self._streamed else self.raw[start:stop]
+                with timed(parser.__name__):
+                    self._parsed_sections[idx] = parser(lines)
+                if not self.__dict__.get('_keep_raw', True):
+                    self._parsed_sections[idx].raw = []
             except IndexError:
                 import warnings
                 warnings.warn(f"Unable to parse {self.title}")
+                self._parsed_sections[idx] = None
             except AttributeError:
                 import warnings
                 warnings.warn(f"Unable to parse {self.title}")
-
-        self.sections = post_process(self.sections)
-
+                self._parsed_sections[idx] = None
+            if not self.__dict__.get('_keep_raw', True) and len(self._parsed_sections) == len(self._section_slices):
+                # every section is parsed: the text is no longer needed, it is read again from the file if asked for
+                self.__dict__.pop('raw', None)
+        return self._parsed_sections[idx]
+
+    def _load_raw(self):
+        if self.filename is None:
+            raise AttributeError("The text of this ConturResult was not kept: pass keep_raw=True")
+        if self._streamed:
+            return self._reader.lines()
+        # a plain read, a ConturSectionReader would keep the file open for as long as the result lives
+        with open(self.filename, 'r') as in_file:
+            return in_file.readlines()
+
+    def _load_reader(self):
+        return ConturSectionReader(self.filename)
+
+    def __getstate__(self):
+        # a memory map cannot be pickled: it is opened again from the file name if more sections are needed
+        state = self.__dict__.copy()
+        state.pop('_reader', None)
+        return state
+
+    def _sections_of(self, parsers):
+        sections = [self._section(idx) for idx, parser in enumerate(self._section_parsers) if parser in parsers]
+        return [x for x in sections if x is not None]
+
+    def _load_sections(self):
+        others = [parser for parser in self._section_parsers if parser != parse_coordinates_and_derivatives]
+        return [*self._sections_of(others), self._coordinate_section]
+
+    def _load_coordinate_section(self):
+        # every COORDINATES AND DERIVATIVES section merged into one, as post_process does for the eager parse
+        return post_process(self._sections_of([parse_coordinates_and_derivatives]))[-1]
+
+    def _load_nozzle_length(self):
         try:
-            self.nozzle_length = self.sections[-1].parameters[0][0][1]
+            return self._coordinate_section.parameters[0][0][1]
         except IndexError:
-            self.nozzle_length = None
+            return None
         except TypeError:
-            self.nozzle_length = None
+            return None
+
+    def _load_characteristics(self):
+        return self._sections_of(characteristic_parsers)
 
-        self.characteristics = [x for x in self.sections if 'Characteristic' in x.class_name]
-        self.contours = [x for x in self.sections if 'Contour' in x.class_name]
-        self.bl_calculations = [x for x in self.sections if 'BoundaryLayer' in x.class_name]
+    def _load_contours(self):
+        return self._sections_of(contour_parsers)
 
-        self.characteristic_tables = []
+    def _load_bl_calculations(self):
+        return self._sections_of([parse_boundary_layer_calculations])
+
+    def _load_characteristic_tables(self):
+        characteristic_tables = []
         for characteristic in self.characteristics:
             if len(characteristic.tables) == 0:
                 pass
             elif len(characteristic.tables) == 1:
-                self.characteristic_tables.append(characteristic.tables[0].to_numpy())
+                characteristic_tables.append(characteristic.tables[0].to_numpy())
             else:
                 import warnings
                 warnings.warn("Too many characteristic tables: none imported for this section")
+        return characteristic_tables
 
+    def _load_design_mach(self):
         try:
-            self.design_mach = self.contours[0].tables[0].Mach[0]
+            return self.contours[0].tables[0].Mach[0]
         except IndexError:
-            self.design_mach = None
+            return None
         except AttributeError:
-            self.design_mach = None
+            return None
         except TypeError:
-            self.design_mach = None
+            return None
 
-        self.contour_tables = []
+    def _load_contour_tables(self):
+        contour_tables = []
         for contour in self.contours:
             if len(contour.tables) == 0:
                 pass
             elif len(contour.tables) == 1:
-                self.contour_tables.append(contour.tables[0].to_numpy())
+                contour_tables.append(contour.tables[0].to_numpy())
             else:
                 import warnings
                 warnings.warn("Too many contour tables: none imported for this section")
+        return contour_tables
 
-        self.bl_tables = []
+    def _load_bl_tables(self):
+        bl_tables = []
         for bl in self.bl_calculations:
             if len(bl.tables) == 0:
                 pass
             elif len(bl.tables) == 1:
-                self.bl_tables.append(bl.tables[0].to_numpy())
+                bl_tables.append(bl.tables[0].to_numpy())
             else:
                 import warnings
                 warnings.warn("Too many boundary layer tables: none imported for this section")
+        return bl_tables
 
+    def _load_wall_table(self):
         try:
-            self._coordinates = \
-                [x for x in self.sections if x.class_name == 'ConturCoordinatesAndDerivatives'][0].tables[0]
+            return self._coordinate_section.tables[0]
+        except IndexError:
+            return None
+        except TypeError:
+            return None
+
+    def _load_coordinates(self):
+        refine_amt = self.refine_amt
+        try:
+            if self._coordinates is None:
+                return None
             if (isinstance(refine_amt, int) or isinstance(refine_amt, float)) and refine_amt > 1:
-                self.coordinates = self.refine_coordinates(refine_amt)
-            else:
-                self.coordinates = self._coordinates
+                return self.refine_coordinates(refine_amt)
+            return self._coordinates
         except IndexError:
             self._coordinates = None
-            self.coordinates = None
+            return None
         except TypeError:
             self._coordinates = None
-            self.coordinates = None
+            return None
 
     @staticmethod
-    def _cubic_spline(x1, x2, y1, y2, s1, s2, n_pts=21):
-        pow0 = np.array([3, 2, 1, 0])
-        pow1 = np.array([2, 1, 0, 0])
-
-        k0 = np.array([1, 1, 1, 1])
-        k1 = np.array([3, 2, 1, 0])
-
-        mat_a = np.array([k0 * x1 ** pow0, k1 * x1 ** pow1, k0 * x2 ** pow0, k1 * x2 ** pow1])
-        mat_b = np.array([y1, s1, y2, s2])
-
-        coefficients = np.linalg.solve(mat_a, mat_b)
-
-        x_vals = np.linspace(x1, x2, n_pts)
-        y_vals = np.sum(coefficients * x_vals[:, None] ** pow0, axis=1)
+    def _hermite_coefficients(arr):
+        # cubic Hermite polynomial of every segment between two wall points, in powers of the local coordinate
+        # t = (x - x1) / (x2 - x1); points with the same X as the one before them are dropped
+        arr = arr[np.argsort(arr[:, 0], kind='stable')]
+        arr = arr[np.concatenate([[True], np.diff(arr[:, 0]) > 0])]
+        x, y, s = arr[:, 0], arr[:, 1], arr[:, 2]
+
+        h = np.diff(x)
+        dy = np.diff(y)
+        coefficients = np.column_stack([
+            y[:-1],
+            h * s[:-1],
+            3 * dy - h * (2 * s[:-1] + s[1:]),
+            h * (s[:-1] + s[1:]) - 2 * dy,
+        ])
+        return x, coefficients
+
+    def _spline(self):
+        if '_spline_coefficients' not in self.__dict__:
+            self._spline_coefficients = self._hermite_coefficients(self._coordinates.to_numpy())
+        return self._spline_coefficients
 
-        return x_vals, y_vals
-
-    def refine_coordinates(self, n_pts=21):
-        arr = self._coordinates.to_numpy()
-        arr = arr[arr[:, 0].argsort()]
-        x = arr[:, 0]
-        y = arr[:, 1]
-        s = arr[:, 2]
-        return np.vstack([np.vstack(self._cubic_spline(
-            x[idx], x[idx + 1],
-            y[idx], y[idx + 1],
-            s[idx], s[idx + 1],
-            n_pts
-        )).T for idx in range(len(x) - 1)])
+    @staticmethod
+    def _evaluate_hermite(coefficients, idx, t):
+        c = coefficients[idx]
+        return c[..., 0] + t * (c[..., 1] + t * (c[..., 2] + t * c[..., 3]))
+
+    @instrumented("refine_coordinates")
+    def refine_coordinates(self, n_pts=21, x=None):
+        # n_pts points per segment between wall points (both ends included, shared ends only once), or the wall at
+        # the given x values (NaN outside the wall)
+        knots, coefficients = self._spline()
+        if len(coefficients) == 0:
+            return np.zeros((0, 2)) if x is None else np.column_stack([x, np.full(len(x), np.nan)])
+
+        if x is None:
+            n_pts = int(n_pts)
+            t = np.linspace(0., 1., n_pts)[:-1]
+            idx = np.repeat(np.arange(len(coefficients)), len(t))
+            t = np.tile(t, len(coefficients))
+            x_vals = np.append(knots[idx] + t * np.diff(knots)[idx], knots[-1])
+            y_vals = np.append(self._evaluate_hermite(coefficients, idx, t), np.sum(coefficients[-1]))
+            return np.column_stack([x_vals, y_vals])
+
+        x_vals = np.asarray(x, dtype=float)
+        idx = np.clip(np.searchsorted(knots, x_vals, side='right') - 1, 0, len(coefficients) - 1)
+        t = (x_vals - knots[idx]) / (knots[idx + 1] - knots[idx])
+        y_vals = self._evaluate_hermite(coefficients, idx, t)
+        y_vals[(x_vals < knots[0]) | (x_vals > knots[-1])] = np.nan
+        return np.column_stack([x_vals, y_vals])
 
     def __repr__(self):
-        return f"ConturResult:\n{len(self.raw):15g} raw lines\n{len(self.sections):15g} output sections"
+        if self.__dict__.get('_streamed'):
+            num_lines = self._reader.num_lines
+        else:
+            num_lines = len(self.raw) if 'raw' in self.__dict__ else self._num_lines
+        return f"ConturResult:\n{num_lines:15g} raw lines\n{len(self.sections):15g} output sections"
 
     def save_all(self, directory):
+        # plotting pulls in matplotlib, which parsing alone never needs
+        from .create_report import save_all
         return save_all(self, directory)
+
+    def _pack(self):
+        # every parsed table packed into one flat array, with the headers, parameter groups and scalars in a dict of
+        # plain values that locates each table in it
+        blocks = []
+        offset = 0
+
+        def store(data):
+            nonlocal offset
+            data = np.asarray(data, dtype=float)
+            blocks.append(data.ravel())
+            offset += data.size
+            return {"offset": offset - data.size, "shape": list(data.shape)}
+
+        def store_table(table):
+            return {**store(table.data), "headers": getattr(table, 'headers', None)}
+
+        sections = []
+        for section in self.sections:
+            single = not isinstance(section.tables, list)
+            tables = [section.tables] if single else section.tables
+            sections.append({"class_name": section.class_name, "parameters": section.parameters, "single": single,
+                             "tables": [store_table(table) for table in tables]})
+
+        coordinates = store(self.coordinates) if isinstance(self.coordinates, np.ndarray) else None
+
+        metadata = {
+            "title": self.title,
+            "filename": None if self.filename is None else os.fspath(self.filename),
+            "refine_amt": self.__dict__.get('refine_amt'),
+            "nozzle_length": self.nozzle_length,
+            "design_mach": None if self.design_mach is None else float(self.design_mach),
+            "sections": sections,
+            "coordinates": coordinates,
+            "coordinates_table": self.coordinates is not None and coordinates is None,
+        }
+        return np.concatenate(blocks) if blocks else np.zeros(0), metadata
+
+    def save(self, filename, raw=False, compress=False):
+        # the packed tables go into an .npz archive, with the metadata as a JSON member next to them
+        data, metadata = self._pack()
+        arrays = {"data": data, "metadata": np.frombuffer(json.dumps(metadata).encode(), dtype=np.uint8)}
+        if raw:
+            arrays["raw"] = np.frombuffer("".join(self.raw).encode(), dtype=np.uint8)
+
+        with open(filename, 'wb') as out_file:
+            (np.savez_compressed if compress else np.savez)(out_file, **arrays)
+
+    @classmethod
+    def load(cls, filename, mmap_mode=True):
+        arrays = _memmap_npz(filename) if mmap_mode else dict(np.load(filename))
+        raw = bytes(arrays["raw"]).decode().splitlines(keepends=True) if "raw" in arrays else []
+        return cls._unpack(arrays["data"], json.loads(bytes(arrays["metadata"]).decode()), raw)
+
+    @classmethod
+    def _unpack(cls, data, metadata, raw=()):
+        # plain ndarray views of the (mapped) buffer, which keep it open
+        data = data.view(np.ndarray)
+
+        def view(block):
+            return data[block["offset"]:block["offset"] + math.prod(block["shape"])].reshape(block["shape"])
+
+        result = cls.__new__(cls)
+        result.filename = metadata["filename"]
+        result.title = metadata["title"]
+        result.refine_amt = metadata["refine_amt"]
+        result.raw = list(raw)
+        result.nozzle_length = metadata["nozzle_length"]
+        result.design_mach = None if metadata["design_mach"] is None else np.float64(metadata["design_mach"])
+
+        result.sections = []
+        for section in metadata["sections"]:
+            tables = [ConturTable._restore(view(table), table["headers"]) for table in section["tables"]]
+            parameters = [[tuple(param) for param in group] for group in section["parameters"]]
+            obj = BaseConturOutput([], parameters, tables[0] if section["single"] else tables)
+            obj.class_name = section["class_name"]
+            result.sections.append(obj)
+
+        result.characteristics = [x for x in result.sections if 'Characteristic' in x.class_name]
+        result.contours = [x for x in result.sections if 'Contour' in x.class_name]
+        result.bl_calculations = [x for x in result.sections if 'BoundaryLayer' in x.class_name]
+        result.characteristic_tables = [x.tables[0].to_numpy() for x in result.characteristics if len(x.tables) == 1]
+        result.contour_tables = [x.tables[0].to_numpy() for x in result.contours if len(x.tables) == 1]
+        result.bl_tables = [x.tables[0].to_numpy() for x in result.bl_calculations if len(x.tables) == 1]
+
+        result._coordinate_section = result.sections[-1] if result.sections else None
+        try:
+            result._coordinates = result._coordinate_section.tables[0]
+        except (AttributeError, IndexError, TypeError):
+            result._coordinates = None
+        if metadata["coordinates"] is not None:
+            result.coordinates = view(metadata["coordinates"])
+        else:
+            result.coordinates = result._coordinates if metadata["coordinates_table"] else None
+        return result
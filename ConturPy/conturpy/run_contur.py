@@ -1,16 +1,43 @@
+import asyncio
+import copy
 import platform
 import subprocess
 import os
 import shutil
 import glob
+import queue
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from .read_output import ConturResult
+from .cache import executable_identity
+from .metrics import instrumented, timed, _in_worker, _merged, _timing
+
+
+class ConturFailure(object):
+    def __init__(self, source, reason, detail=None):
+        self.source = source
+        self.reason = reason
+        self.detail = detail
+
+    def __repr__(self):
+        detail = "" if self.detail is None else f": {self.detail}"
+        return f"ConturFailure({self.source}, {self.reason}{detail})"
 
 
 class ConturApplication(object):
-    def __init__(self, location=os.getcwd(), timeout=0.5, executable=None):
+    def __init__(self, location=os.getcwd(), timeout=0.5, executable=None, scratch_dir=None, cache=None,
+                 scheduler=None, keep_raw=False):
         self.location = location
         self.timeout = timeout
+        self.scratch_dir = scratch_dir
+        self.cache = cache
+        self.scheduler = scheduler
+        # results whose output is not kept on disk have no file to read their text from again
+        self.keep_raw = keep_raw
 
         if executable is None:
             bin_path = Path(__file__).parent.joinpath('bin/')
@@ -25,59 +52,426 @@ class ConturApplication(object):
                 raise Exception(f"Platform {plat} is not supported")
         self.executable = executable
         self._expected_to_exist = False
+        self._identity = None
+        # runtimes measured in a process pool worker, sent back to the parent's scheduler
+        self._runtimes = None
 
-    def run(self):
-        assert self._exists
+    def run(self, wd=None, timeout=None):
+        assert self._exists()
+        wd = self.location if wd is None else wd
+        timeout = self.timeout if timeout is None else timeout
         try:
-            subprocess.check_output(self.executable, timeout=self.timeout, cwd=self.location)
+            with timed("run"):
+                subprocess.check_output(self._executable_path(), timeout=timeout, cwd=wd)
             success = True
         except subprocess.TimeoutExpired:
             success = False
         return success
 
-    def _run_single_file(self, file, output_dir, refine_amt=21):
-        shutil.copyfile(file, os.path.join(self.location, 'input.txt'))
-        success = self.run()
-        if success:
-            flag, newfile = self._move_output(like_source_fn=file, dest_folder=output_dir)
+    def _executable_path(self):
+        # a relative executable has always been resolved against self.location, keep that when running elsewhere
+        return os.path.join(self.location, self.executable)
+
+    def _cache_key(self, deck):
+        if self.cache is None:
+            return None
+        if self._identity is None:
+            self._identity = executable_identity(self._executable_path())
+        return self.cache.key(deck, self._identity)
+
+    def _from_cache(self, key, dest, refine_amt):
+        if key is None:
+            return None
+        return self.cache.get(key, refine_amt=refine_amt, dest=dest)
+
+    def _timeouts(self, deck):
+        if self.scheduler is None:
+            return [self.timeout]
+        return self.scheduler.timeouts(deck)
+
+    def _record(self, deck, start):
+        if self.scheduler is not None:
+            runtime = time.perf_counter() - start
+            self.scheduler.record(deck, runtime)
+            if self._runtimes is not None:
+                self._runtimes.append((deck, runtime))
+
+    @staticmethod
+    def _timeout_failure(file, timeouts):
+        return ConturFailure(file, "timeout", "no result within " + ", ".join([f"{t:g}" for t in timeouts]) + " s")
+
+    def _run_scheduled(self, deck, wd):
+        timeouts = self._timeouts(deck)
+        for timeout in timeouts:
+            start = time.perf_counter()
+            if self.run(wd, timeout=timeout):
+                self._record(deck, start)
+                return True, timeouts
+        return False, timeouts
+
+    @staticmethod
+    @instrumented("collect_output")
+    def _collect_output(src, dest=None):
+        # read CONTUR's output once: it is parsed from memory and only written out again if it is being kept
+        if not os.path.exists(src):
+            return None
+        with open(src, 'r') as in_file:
+            text = in_file.read()
+        if dest is not None:
+            with open(dest, 'w') as out_file:
+                out_file.write(text)
+        return text
+
+    def _parse_output(self, file, text, dest, key, refine_amt):
+        try:
+            result = ConturResult.from_text(text, refine_amt=refine_amt, filename=dest, keep_raw=self.keep_raw)
+        except Exception as err:
+            return ConturFailure(file, "parse", err)
+        if key is not None:
+            self.cache.put(key, text, result, refine_amt=refine_amt)
+        return result
+
+    def _run_deck(self, deck, source, dest=None, refine_amt=21, wd=None):
+        key = self._cache_key(deck)
+        cached = self._from_cache(key, dest, refine_amt)
+        if cached is not None:
+            return cached
+
+        wd = self.location if wd is None else wd
+        with open(os.path.join(wd, 'input.txt'), 'w') as out_file:
+            out_file.write(deck)
+        # working directories are reused, never pick up the previous job's output
+        if os.path.exists(os.path.join(wd, 'output.txt')):
+            os.remove(os.path.join(wd, 'output.txt'))
+
+        try:
+            success, timeouts = self._run_scheduled(deck, wd)
+        except subprocess.CalledProcessError as err:
+            return ConturFailure(source, "error", err)
+        if not success:
+            return self._timeout_failure(source, timeouts)
+
+        text = self._collect_output(os.path.join(wd, 'output.txt'), dest)
+        if text is None:
+            return ConturFailure(source, "no output")
+        return self._parse_output(source, text, dest, key, refine_amt)
+
+    def _run_single_file(self, file, output_dir, refine_amt=21, wd=None, keep_output=True):
+        with open(file, 'r') as in_file:
+            deck = in_file.read()
+        dest = self._result_path(file, output_dir) if keep_output else None
+        result = self._run_deck(deck, file, dest, refine_amt=refine_amt, wd=wd)
+
+        # decks that did not run to completion are left in place so they can be resubmitted
+        if not isinstance(result, ConturFailure) or result.reason not in ("error", "timeout"):
             os.remove(file)
+        return result
 
-            if flag == 1:
-                return ConturResult(newfile, refine_amt=refine_amt)
-            else:
-                return None
+    def _run_isolated(self, file, output_dir, refine_amt=21, keep_output=True):
+        with tempfile.TemporaryDirectory(prefix='contur_', dir=self.scratch_dir) as wd:
+            return self._run_single_file(file, output_dir, refine_amt=refine_amt, wd=wd, keep_output=keep_output)
 
-    def batch_input_files(self, file_list, output_dir=os.getcwd(), refine_amt=21):
-        results = []
-        for file in file_list:
-            results.append(self._run_single_file(file, output_dir, refine_amt=refine_amt))
-        results = [x for x in results if x is not None]
-        self.clean_wd()
-        return results
+    def _in_process(self, fun, timing, *args):
+        # run in a process pool worker, on copies of the cache and scheduler: what they counted and measured there is
+        # sent back with the result, along with the stage timings, and applied in the parent by _from_process
+        counts = None if self.cache is None else self.cache._counts()
+        self._runtimes = []
+        result, samples = _in_worker(timing, fun, *args)
+        if counts is not None:
+            counts = {name: value - counts[name] for name, value in self.cache._counts().items()}
+        return result, counts, self._runtimes, samples
+
+    def _from_process(self, result, counts, runtimes, samples):
+        if counts is not None:
+            for name, value in counts.items():
+                self.cache._count(name, value)
+        if self.scheduler is not None:
+            for deck, runtime in runtimes:
+                self.scheduler.record(deck, runtime)
+        return _merged(result, samples)
+
+    def _map(self, executor, use_processes, fun, *iterables):
+        if not use_processes:
+            return list(executor.map(fun, *iterables))
+        mapped = executor.map(self._in_process, repeat(fun), repeat(_timing()), *iterables)
+        return [self._from_process(*x) for x in mapped]
+
+    @staticmethod
+    def _packed_deck(settings):
+        # after a case CONTUR reads card 3 of the same case again unless BJ < 0, which sends it back to card 1 for the
+        # next case; with XEND > 0 the output is the same as for BJ = 0. None for decks that read on into the next case
+        # and for XMID != 0, which sets an interpolation index that CONTUR keeps for every later case
+        try:
+            packable = settings["XBL"] == 1000 and settings["XEND"] > 0 and settings["IT"] == 0 and \
+                settings["JX"] <= 0 and settings["BJ"] <= 0 and settings["XMID"] == 0 and \
+                settings._deck_cards()[-1] is settings._cardD
+        except (AttributeError, TypeError):
+            return None
+        if not packable:
+            return None
+        settings = copy.deepcopy(settings)
+        settings["BJ"] = -1
+        return settings.get_deck()
+
+    @staticmethod
+    def _split_cases(text, titles):
+        # the output of each case starts at the first line holding its title, a case is complete once the next begins
+        lines = text.splitlines(keepends=True)
+        starts = []
+        for title in titles:
+            start = next((idx for idx in range(starts[-1] + 1 if starts else 0, len(lines)) if title in lines[idx]),
+                         None)
+            if start is None:
+                break
+            starts.append(start)
+        return ["".join(lines[start:end]) for start, end in zip(starts, [*starts[1:], len(lines)])]
 
-    def batch_input_folder(self, folder, output_dir=os.getcwd(), refine_amt=21):
-        results = []
-        for file in glob.glob(os.path.join(folder, '*.txt')):
-            results.append(self._run_single_file(file, output_dir, refine_amt=refine_amt))
-        results = [x for x in results if x is not None]
-        self.clean_wd()
+    def _run_pack(self, pack, refine_amt=21, wd=None):
+        # pack holds (deck, packed deck, title, source, dest) for each case; all cases that are not cached run in one
+        # CONTUR process and are split by title, cases without complete output are run again on their own
+        wd = self.location if wd is None else wd
+        keys = [self._cache_key(deck) for deck, _, _, _, _ in pack]
+        results = [self._from_cache(key, dest, refine_amt) for key, (_, _, _, _, dest) in zip(keys, pack)]
+        todo = [idx for idx, result in enumerate(results) if result is None]
+
+        texts = []
+        if len(todo) > 1:
+            with open(os.path.join(wd, 'input.txt'), 'w') as out_file:
+                out_file.write("".join([pack[idx][1] for idx in todo]))
+            if os.path.exists(os.path.join(wd, 'output.txt')):
+                os.remove(os.path.join(wd, 'output.txt'))
+
+            timeout = sum([self._timeouts(pack[idx][0])[-1] for idx in todo])
+            try:
+                success = self.run(wd, timeout=timeout)
+            except subprocess.CalledProcessError:
+                success = False
+            text = self._collect_output(os.path.join(wd, 'output.txt'))
+            texts = [] if text is None else self._split_cases(text, [pack[idx][2] for idx in todo])
+            if not success:
+                texts = texts[:-1]
+
+        for idx, case_text in zip(todo, texts):
+            deck, _, _, source, dest = pack[idx]
+            if dest is not None:
+                with open(dest, 'w') as out_file:
+                    out_file.write(case_text)
+            results[idx] = self._parse_output(source, case_text, dest, keys[idx], refine_amt)
+        for idx in todo[len(texts):]:
+            deck, _, _, source, dest = pack[idx]
+            results[idx] = self._run_deck(deck, source, dest, refine_amt=refine_amt, wd=wd)
         return results
 
+    def _run_pack_isolated(self, pack, refine_amt=21):
+        with tempfile.TemporaryDirectory(prefix='contur_', dir=self.scratch_dir) as wd:
+            return self._run_pack(pack, refine_amt=refine_amt, wd=wd)
+
+    def _run_packs(self, settings_list, indices, sources, output_dir, refine_amt=21, workers=1, use_processes=False,
+                   pack_size=25):
+        # consecutive packable decks with different titles share a CONTUR run, every other deck runs on its own
+        packs = []
+        titles = set()
+        for idx in indices:
+            settings = settings_list[idx]
+            deck = settings.get_deck()
+            packed_deck = self._packed_deck(settings)
+            # the title as CONTUR prints it in every section
+            title = deck[1:11]
+            dest = None if output_dir is None else self._result_path(sources[idx], output_dir)
+            case = (deck, packed_deck, title, sources[idx], dest)
+
+            if packed_deck is None or not packs or len(packs[-1]) >= pack_size or title in titles or \
+                    packs[-1][-1][1] is None:
+                packs.append([])
+                titles = set()
+            packs[-1].append(case)
+            titles.add(title)
+
+        if workers is None or workers > 1:
+            pool = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+            with pool(max_workers=os.cpu_count() if workers is None else workers) as executor:
+                results = self._map(executor, use_processes, self._run_pack_isolated, packs, repeat(refine_amt))
+        else:
+            results = [self._run_pack(pack, refine_amt=refine_amt) for pack in packs]
+            self.clean_wd()
+        return [result for pack_results in results for result in pack_results]
+
+    def _run_batch(self, file_list, output_dir, refine_amt=21, workers=1, use_processes=False, return_failures=False,
+                   keep_output=True):
+        if workers is None or workers > 1:
+            pool = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+            # one CONTUR process per core: a thread pool would otherwise start min(32, cores + 4) of them
+            with pool(max_workers=os.cpu_count() if workers is None else workers) as executor:
+                results = self._map(executor, use_processes, self._run_isolated, file_list, repeat(output_dir),
+                                    repeat(refine_amt), repeat(keep_output))
+        else:
+            results = [self._run_single_file(file, output_dir, refine_amt=refine_amt, keep_output=keep_output)
+                       for file in file_list]
+            self.clean_wd()
+
+        if return_failures:
+            return results
+        failures = [x for x in results if isinstance(x, ConturFailure)]
+        if failures:
+            import warnings
+            warnings.warn(f"{len(failures)} of {len(results)} CONTUR runs failed: " +
+                          ", ".join([f"{x.source} ({x.reason})" for x in failures]))
+        return [x for x in results if not isinstance(x, ConturFailure)]
+
+    def batch_input_files(self, file_list, output_dir=os.getcwd(), refine_amt=21, workers=1, use_processes=False,
+                          return_failures=False, keep_output=True):
+        return self._run_batch(list(file_list), output_dir, refine_amt=refine_amt, workers=workers,
+                               use_processes=use_processes, return_failures=return_failures, keep_output=keep_output)
+
+    def batch_input_folder(self, folder, output_dir=os.getcwd(), refine_amt=21, workers=1, use_processes=False,
+                           return_failures=False, keep_output=True):
+        return self._run_batch(glob.glob(os.path.join(folder, '*.txt')), output_dir, refine_amt=refine_amt,
+                               workers=workers, use_processes=use_processes, return_failures=return_failures,
+                               keep_output=keep_output)
+
     @staticmethod
-    def _move_output(dest_fn=None, like_source_fn=None, dest_folder=None,
-                     src=os.path.join(os.getcwd(), 'output.txt')):
-        if not os.path.exists(src):
-            return -1, None
+    def _deck_problems(settings_list):
+        if hasattr(settings_list, 'validate'):
+            return settings_list.validate()
+        problems = {}
+        for idx, settings in enumerate(settings_list):
+            deck_problems = settings.validate()
+            if deck_problems:
+                problems[idx] = deck_problems
+        return problems
+
+    def batch_settings(self, settings_list, output_dir=None, refine_amt=21, workers=1, use_processes=False,
+                       validate=True, pack_size=1):
+        # failed runs are kept as ConturFailure so results line up with settings_list, outputs are only written to
+        # disk if an output_dir is given
+        # decks that fail validation are never run, they come back as ConturFailure(..., "invalid", problems)
+        # with pack_size > 1, up to pack_size decks run one after the other in a single CONTUR process
+        if not hasattr(settings_list, 'print_to_inputs'):
+            settings_list = list(settings_list)
+        problems = self._deck_problems(settings_list) if validate else {}
+        if problems:
+            import warnings
+            warnings.warn(f"{len(problems)} of {len(settings_list)} decks are invalid and will not be run: " +
+                          "; ".join([f"case {idx}: " + ", ".join(deck_problems)
+                                     for idx, deck_problems in list(problems.items())[:10]]) +
+                          ("; ..." if len(problems) > 10 else ""))
+
+        valid = [idx for idx in range(len(settings_list)) if idx not in problems]
+        with tempfile.TemporaryDirectory(prefix='contur_decks_', dir=self.scratch_dir) as deck_dir:
+            sources = [os.path.join(deck_dir, f"case{idx:06d}.txt") for idx in range(len(settings_list))]
+            if pack_size > 1:
+                results = self._run_packs(settings_list, valid, sources, output_dir, refine_amt=refine_amt,
+                                          workers=workers, use_processes=use_processes, pack_size=pack_size)
+            else:
+                if hasattr(settings_list, 'print_to_inputs'):
+                    # a ConturSettingsBatch writes all of its decks in one pass
+                    file_list = settings_list.print_to_inputs(deck_dir, file_name="case{idx:06d}.txt",
+                                                              indices=valid if problems else None)
+                else:
+                    file_list = []
+                    for idx in valid:
+                        settings_list[idx].print_to_input(file_name=os.path.basename(sources[idx]),
+                                                          output_directory=deck_dir)
+                        file_list.append(sources[idx])
+                results = self._run_batch(file_list, output_dir, refine_amt=refine_amt, workers=workers,
+                                          use_processes=use_processes, return_failures=True,
+                                          keep_output=output_dir is not None)
+
+            results = iter(results)
+            return [ConturFailure(sources[idx], "invalid", ", ".join(problems[idx])) if idx in problems
+                    else next(results) for idx in range(len(settings_list))]
+
+    async def run_async(self, wd=None, timeout=None):
+        assert self._exists()
+        wd = self.location if wd is None else wd
+        timeout = self.timeout if timeout is None else timeout
+        proc = await asyncio.create_subprocess_exec(self._executable_path(), cwd=wd,
+                                                    stdout=asyncio.subprocess.DEVNULL,
+                                                    stderr=asyncio.subprocess.DEVNULL)
+        try:
+            with timed("run"):
+                await asyncio.wait_for(proc.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            # also when the run is cancelled: CONTUR must not keep running in a scratch directory that is being removed
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, self._executable_path())
+        return True
+
+    async def _run_scheduled_async(self, deck, wd):
+        timeouts = self._timeouts(deck)
+        for timeout in timeouts:
+            start = time.perf_counter()
+            if await self.run_async(wd, timeout=timeout):
+                self._record(deck, start)
+                return True, timeouts
+        return False, timeouts
+
+    async def _run_single_file_async(self, file, output_dir, refine_amt, semaphore, keep_output=True):
+        with open(file, 'r') as in_file:
+            deck = in_file.read()
+        dest = self._result_path(file, output_dir) if keep_output else None
+        key = self._cache_key(deck)
+        cached = self._from_cache(key, dest, refine_amt)
+        if cached is not None:
+            os.remove(file)
+            return cached
+
+        async with semaphore:
+            with tempfile.TemporaryDirectory(prefix='contur_', dir=self.scratch_dir) as wd:
+                shutil.copyfile(file, os.path.join(wd, 'input.txt'))
+                try:
+                    success, timeouts = await self._run_scheduled_async(deck, wd)
+                except subprocess.CalledProcessError as err:
+                    return ConturFailure(file, "error", err)
+                if not success:
+                    return self._timeout_failure(file, timeouts)
+
+                text = self._collect_output(os.path.join(wd, 'output.txt'), dest)
+                os.remove(file)
+
+        if text is None:
+            return ConturFailure(file, "no output")
+
+        # parsing is CPU bound, keep it off the event loop so other runs keep streaming
+        return await asyncio.get_running_loop().run_in_executor(None, self._parse_output, file, text, dest, key,
+                                                                refine_amt)
+
+    async def batch_input_files_async(self, file_list, output_dir=os.getcwd(), refine_amt=21, concurrency=4,
+                                      keep_output=True):
+        semaphore = asyncio.Semaphore(concurrency)
+        tasks = [asyncio.ensure_future(self._run_single_file_async(file, output_dir, refine_amt, semaphore,
+                                                                   keep_output=keep_output))
+                 for file in file_list]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+            # wait for the cancelled runs to kill their CONTUR processes before their directories go
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def batch_input_folder_async(self, folder, output_dir=os.getcwd(), refine_amt=21, concurrency=4,
+                                       keep_output=True):
+        async for result in self.batch_input_files_async(glob.glob(os.path.join(folder, '*.txt')), output_dir,
+                                                         refine_amt=refine_amt, concurrency=concurrency,
+                                                         keep_output=keep_output):
+            yield result
+
+    @staticmethod
+    def _result_path(like_source_fn=None, dest_folder=None, dest_fn=None):
         if like_source_fn is not None:
             dest_fn = os.path.split(like_source_fn)[-1].replace('.txt', '_result.txt')
         else:
             dest_fn = 'output.txt' if dest_fn is None else dest_fn
 
         dest_folder = os.getcwd() if dest_folder is None else dest_folder
-        newfile = os.path.join(dest_folder, dest_fn)
-        shutil.copyfile(src, newfile)
-
-        return 1, newfile
+        return os.path.join(dest_folder, dest_fn)
 
     def clean_wd(self, wd=None):
         if wd is None:
@@ -90,9 +484,12 @@ class ConturApplication(object):
         if os.path.exists(output_file):
             os.remove(output_file)
 
+    def pool(self, workers=None):
+        return ConturWorkerPool(self, workers=workers)
+
     def _exists(self):
         if not self._expected_to_exist:
-            exists = os.path.exists(self.executable)
+            exists = os.path.exists(self._executable_path())
             if exists:
                 self._expected_to_exist = True
                 return True
@@ -106,3 +503,107 @@ class ConturApplication(object):
             return f"CONTUR Executable at {self.executable}"
         else:
             return f"CONTUR Executable NOT FOUND (expected at {self.executable})"
+
+
+class ConturWorkerPool(object):
+    def __init__(self, application, workers=None):
+        self.application = application
+        self.workers = os.cpu_count() if workers is None else workers
+
+        self.runs = 0
+        self.failures = 0
+        self._lock = threading.Lock()
+        self._root = None
+        self._free = None
+        self._executor = None
+        self._start = None
+        self._stop = None
+
+    def _provision(self, wd):
+        # each worker gets its own link to the executable and runs with the worker directory as its location
+        source = os.path.abspath(self.application._executable_path())
+        link = os.path.join(wd, os.path.basename(source))
+        try:
+            os.symlink(source, link)
+        except OSError:
+            shutil.copy2(source, link)
+
+        worker = copy.copy(self.application)
+        worker.location = wd
+        worker.executable = os.path.basename(link)
+        worker._expected_to_exist = True
+        return worker
+
+    def __enter__(self):
+        app = self.application
+        assert app._exists()
+        if app.cache is not None and app._identity is None:
+            app._identity = executable_identity(app._executable_path())
+
+        self._root = tempfile.mkdtemp(prefix='contur_pool_', dir=app.scratch_dir)
+        self._free = queue.Queue()
+        for idx in range(self.workers):
+            wd = os.path.join(self._root, f"worker{idx:03d}")
+            os.mkdir(wd)
+            self._free.put(self._provision(wd))
+
+        self._executor = ThreadPoolExecutor(max_workers=self.workers)
+        self.runs = 0
+        self.failures = 0
+        self._start = time.perf_counter()
+        self._stop = None
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._executor.shutdown(wait=True)
+        self._stop = time.perf_counter()
+        shutil.rmtree(self._root, ignore_errors=True)
+
+    def _run(self, deck, source, dest, refine_amt):
+        worker = self._free.get()
+        try:
+            result = worker._run_deck(deck, source, dest, refine_amt=refine_amt)
+        finally:
+            self._free.put(worker)
+        with self._lock:
+            self.runs += 1
+            if isinstance(result, ConturFailure):
+                self.failures += 1
+        return result
+
+    def submit(self, deck, source=None, dest=None, refine_amt=21):
+        deck = deck.get_deck() if hasattr(deck, 'get_deck') else deck
+        return self._executor.submit(self._run, deck, source, dest, refine_amt)
+
+    def map(self, decks, refine_amt=21):
+        futures = [self.submit(deck, source=idx, refine_amt=refine_amt) for idx, deck in enumerate(decks)]
+        return [future.result() for future in futures]
+
+    def batch_input_files(self, file_list, output_dir=os.getcwd(), refine_amt=21, keep_output=True):
+        futures = []
+        for file in file_list:
+            with open(file, 'r') as in_file:
+                deck = in_file.read()
+            dest = self.application._result_path(file, output_dir) if keep_output else None
+            futures.append(self.submit(deck, source=file, dest=dest, refine_amt=refine_amt))
+        return [future.result() for future in futures]
+
+    @property
+    def elapsed(self):
+        if self._start is None:
+            return 0.
+        return (time.perf_counter() if self._stop is None else self._stop) - self._start
+
+    @property
+    def runs_per_second(self):
+        return self.runs / self.elapsed if self.elapsed > 0 else 0.
+
+    def stats(self):
+        return {"workers": self.workers, "runs": self.runs, "failures": self.failures, "elapsed": self.elapsed,
+                "runs_per_second": self.runs_per_second}
+
+    def __repr__(self):
+        return f"ConturWorkerPool:\n" \
+               f"{self.workers:15g} workers\n" \
+               f"{self.runs:15g} runs\n" \
+               f"{self.runs_per_second:15.1f} runs/second"
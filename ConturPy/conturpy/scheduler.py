@@ -0,0 +1,83 @@
+import json
+import threading
+import numpy as np
+
+
+def deck_signature(deck):
+    # card 4 holds the point counts that drive CONTUR's run time, the number of cards tells apart which boundary
+    # layer and interpolation cards follow it
+    lines = deck.splitlines()
+    card4 = " ".join(lines[3].split()) if len(lines) > 3 else ""
+    return f"{len(lines)}|{card4}"
+
+
+class ConturScheduler(object):
+    def __init__(self, initial_timeout=0.5, min_timeout=0.1, max_timeout=30., safety=2., spread=3., retries=1,
+                 retry_factor=4., min_samples=3):
+        self.initial_timeout = initial_timeout
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.safety = safety
+        self.spread = spread
+        self.retries = retries
+        self.retry_factor = retry_factor
+        self.min_samples = min_samples
+
+        # signature -> [count, mean, M2, max], updated with Welford's algorithm
+        self.stats = {}
+        self._lock = threading.Lock()
+
+    def record(self, deck, runtime):
+        signature = deck_signature(deck)
+        with self._lock:
+            count, mean, m2, max_runtime = self.stats.get(signature, [0, 0., 0., 0.])
+            count += 1
+            delta = runtime - mean
+            mean += delta / count
+            m2 += delta * (runtime - mean)
+            self.stats[signature] = [count, mean, m2, max(max_runtime, runtime)]
+
+    def expected_runtime(self, deck):
+        count, mean, m2, max_runtime = self.stats.get(deck_signature(deck), [0, 0., 0., 0.])
+        if count == 0 or count < self.min_samples:
+            return None
+        # a single sample has no spread, its max still bounds the budget
+        std = np.sqrt(m2 / (count - 1)) if count > 1 else 0.
+        return mean, std, max_runtime
+
+    def timeout_for(self, deck):
+        expected = self.expected_runtime(deck)
+        if expected is None:
+            return self.initial_timeout
+        mean, std, max_runtime = expected
+        budget = self.safety * max(mean + self.spread * std, max_runtime)
+        return float(min(self.max_timeout, max(self.min_timeout, budget)))
+
+    def timeouts(self, deck):
+        budget = self.timeout_for(deck)
+        return [budget, *[min(self.max_timeout, budget * self.retry_factor ** (k + 1)) for k in range(self.retries)]]
+
+    def save(self, filename):
+        with open(filename, 'w') as out_file:
+            json.dump(self.stats, out_file)
+
+    def load(self, filename):
+        with open(filename, 'r') as in_file:
+            stats = json.load(in_file)
+        with self._lock:
+            self.stats.update(stats)
+        return self
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"ConturScheduler:\n" \
+               f"{len(self.stats):15g} deck signatures\n" \
+               f"{sum(x[0] for x in self.stats.values()):15g} recorded runs"
@@ -0,0 +1,138 @@
+import itertools
+import numpy as np
+from .create_input_cards import ConturSettings, ConturSettingsBatch
+from .run_contur import ConturFailure
+
+
+def exit_radius(r):
+    coords = r._coordinates
+    if coords is None or len(coords.data) == 0:
+        return np.nan
+    # same cut as the plotting helpers: anything past the nozzle length is the parallel extension
+    msk = coords.X_IN <= r.nozzle_length if r.nozzle_length is not None else np.ones(len(coords.X_IN), dtype=bool)
+    if not np.any(msk):
+        return np.nan
+    return coords.Y_IN[msk][np.argmax(coords.X_IN[msk])]
+
+
+default_outputs = {
+    "nozzle_length": lambda r: r.nozzle_length,
+    "design_mach": lambda r: r.design_mach,
+    "exit_radius": exit_radius,
+}
+
+
+class ConturSweepResults(object):
+    def __init__(self, columns, results):
+        self.columns = columns
+        self.results = results
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def __len__(self):
+        return len(self.results)
+
+    @property
+    def headers(self):
+        return list(self.columns)
+
+    def to_numpy(self):
+        return np.vstack([np.asarray(col, dtype=float) for col in self.columns.values() if col.dtype.kind != 'U']).T
+
+    def to_pandas(self):
+        import pandas as pd
+        return pd.DataFrame(self.columns)
+
+    def __repr__(self):
+        return f"ConturSweepResults:\n" \
+               f"{len(self):15g} cases\n" \
+               f"{int(np.sum(self.columns['success'])):15g} successful\n" \
+               f"{len(self.columns):15g} columns"
+
+
+class ConturSweep(object):
+    def __init__(self, parameters, base_settings=None):
+        # each parameter is a sequence of explicit values, a (low, high) tuple for a uniform range, or a callable
+        # mapping an array of uniform [0, 1) samples to values (e.g. scipy.stats.norm(6, .1).ppf)
+        self.parameters = dict(parameters)
+        self.base_settings = ConturSettings() if base_settings is None else base_settings
+
+        for label in self.parameters:
+            self.base_settings[label]  # raises AttributeError for unknown card labels
+
+    @staticmethod
+    def _is_range(spec):
+        return isinstance(spec, tuple) and len(spec) == 2
+
+    def _from_unit(self, spec, u):
+        if callable(spec):
+            return np.asarray(spec(u))
+        if self._is_range(spec):
+            return spec[0] + u * (spec[1] - spec[0])
+        values = np.asarray(spec)
+        return values[np.minimum((u * len(values)).astype(int), len(values) - 1)]
+
+    def _grid_values(self, spec, n):
+        if callable(spec):
+            return self._from_unit(spec, (np.arange(n) + .5) / n)
+        if self._is_range(spec):
+            return np.linspace(spec[0], spec[1], n)
+        return np.asarray(spec)
+
+    def samples(self, method="grid", n=None, seed=None):
+        labels = list(self.parameters)
+
+        if method == "grid":
+            if n is None and any(self._is_range(spec) or callable(spec) for spec in self.parameters.values()):
+                raise ValueError("Grid sweeps over ranges or distributions need the number of points per axis, n")
+            axes = [self._grid_values(self.parameters[label], n) for label in labels]
+            points = list(itertools.product(*axes))
+            return {label: np.array([point[idx] for point in points]) for idx, label in enumerate(labels)}
+
+        if method not in ("lhs", "sobol"):
+            raise ValueError(f"Unknown sampling method '{method}': use 'grid', 'lhs' or 'sobol'")
+        if n is None:
+            raise ValueError(f"{method} sampling needs the number of samples, n")
+
+        from scipy.stats import qmc
+        if method == "lhs":
+            unit = qmc.LatinHypercube(d=len(labels), seed=seed).random(n)
+        else:
+            unit = qmc.Sobol(d=len(labels), scramble=True, seed=seed).random(n)
+
+        return {label: self._from_unit(self.parameters[label], unit[:, idx]) for idx, label in enumerate(labels)}
+
+    def decks(self, samples):
+        return ConturSettingsBatch(samples, self.base_settings)
+
+    def run(self, application, method="grid", n=None, seed=None, outputs=None, workers=None, refine_amt=1,
+            output_dir=None, use_processes=False):
+        return self.evaluate(application, self.samples(method=method, n=n, seed=seed), outputs=outputs,
+                             workers=workers, refine_amt=refine_amt, output_dir=output_dir, use_processes=use_processes)
+
+    def evaluate(self, application, samples, outputs=None, workers=None, refine_amt=1, output_dir=None,
+                 use_processes=False):
+        outputs = default_outputs if outputs is None else outputs
+        results = application.batch_settings(self.decks(samples), output_dir=output_dir, refine_amt=refine_amt,
+                                             workers=workers, use_processes=use_processes)
+
+        columns = dict(samples)
+        columns["success"] = np.array([not isinstance(r, ConturFailure) for r in results])
+        columns["failure"] = np.array([r.reason if isinstance(r, ConturFailure) else "" for r in results])
+        for name, extract in outputs.items():
+            column = np.full(len(results), np.nan)
+            for idx, r in enumerate(results):
+                if isinstance(r, ConturFailure):
+                    continue
+                try:
+                    value = extract(r)
+                except (AttributeError, IndexError, TypeError):
+                    value = None
+                column[idx] = np.nan if value is None else value
+            columns[name] = column
+
+        return ConturSweepResults(columns, results)
+
+    def __repr__(self):
+        return "ConturSweep:\n" + "".join([f"{label:>15s}: {spec}\n" for label, spec in self.parameters.items()])
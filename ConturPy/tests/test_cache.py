@@ -0,0 +1,57 @@
+import os
+from conturpy import ConturCache
+
+
+def _counting(cache):
+    scans = []
+    entries = cache._entries
+
+    def counted():
+        scans.append(1)
+        return entries()
+    cache._entries = counted
+    return scans
+
+
+def _size(directory):
+    return sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+
+
+def test_put_does_not_rescan_below_limit(tmp_path):
+    cache = ConturCache(str(tmp_path), max_size=1e9)
+    scans = _counting(cache)
+    for idx in range(200):
+        cache.put(f"{idx:064x}", "x" * 1000)
+    assert len(scans) <= 200 // cache._scan_every + 1
+    assert cache.stats()["entries"] == 200
+
+
+def test_put_keeps_size_below_limit(tmp_path):
+    cache = ConturCache(str(tmp_path), max_size=100_000)
+    scans = _counting(cache)
+    for idx in range(500):
+        cache.put(f"{idx:064x}", "x" * 1000)
+        assert _size(tmp_path) <= cache.max_size
+    assert len(scans) < 100
+    # the most recently put entries are the ones kept
+    assert os.path.exists(os.path.join(tmp_path, f"{499:064x}.txt"))
+    assert cache.evictions == 500 - cache.stats()["entries"]
+
+
+def test_overwrite_is_not_counted_twice(tmp_path):
+    cache = ConturCache(str(tmp_path), max_size=1e9)
+    for _ in range(10):
+        cache.put("0" * 64, "x" * 1000)
+    assert cache._size == _size(tmp_path) == 1000
+
+
+def test_entries_from_other_processes_are_picked_up(tmp_path):
+    cache = ConturCache(str(tmp_path), max_size=150_000)
+    other = ConturCache(str(tmp_path), max_size=None)
+    cache.put("0" * 64, "x" * 1000)
+    for idx in range(1, 201):
+        other.put(f"{idx:064x}", "x" * 1000)
+    for idx in range(201, 200 + cache._scan_every):
+        assert _size(tmp_path) > cache.max_size
+        cache.put(f"{idx:064x}", "x" * 1000)
+    assert _size(tmp_path) <= cache.max_size
@@ -0,0 +1,45 @@
+import os
+import stat
+import subprocess
+import sys
+import warnings
+from pathlib import Path
+import numpy as np
+import pytest
+from conturpy import ConturApplication, ConturFailure, ConturResult, ConturSpoolCoordinator, ConturSpoolWorker
+
+OUTPUT = Path(__file__).parent / "data" / "m4_output.txt"
+
+
+def test_worker_module_runs_without_warning():
+    process = subprocess.run([sys.executable, "-W", "error::RuntimeWarning", "-m", "conturpy.distributed", "--help"],
+                             capture_output=True, text=True, cwd=Path(__file__).parent.parent)
+    assert process.returncode == 0, process.stderr
+    assert "RuntimeWarning" not in process.stderr
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="the stand-in executable is a shell script")
+def test_results_round_trip_without_pickle(tmp_path):
+    # a stand-in for CONTUR that fails on "broken" decks and writes a recorded output otherwise
+    executable = tmp_path / "contur"
+    executable.write_text(f"#!/bin/sh\ngrep -q broken input.txt && exit 3\ncp {OUTPUT} output.txt\n")
+    executable.chmod(executable.stat().st_mode | stat.S_IEXEC)
+    spool = tmp_path / "spool"
+
+    coordinator = ConturSpoolCoordinator(str(spool))
+    job_ids = coordinator.submit(["  Case m4    0 \n", "  broken\n"])
+    application = ConturApplication(location=str(tmp_path), executable=str(executable), timeout=10)
+    worker = ConturSpoolWorker(str(spool), application)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        assert worker.serve(max_jobs=2) == 2
+        expected = ConturResult(OUTPUT)
+    assert sorted(os.listdir(spool / "results")) == [job_ids[0] + ".npz", job_ids[1] + ".json"]
+
+    result, failure = coordinator.gather(job_ids)
+    assert result.design_mach == expected.design_mach
+    np.testing.assert_array_equal(result.coordinates, expected.coordinates)
+    assert isinstance(failure, ConturFailure)
+    assert (failure.source, failure.reason) == (job_ids[1], "error")
+    assert isinstance(failure.detail, str)
+    assert os.listdir(spool / "results") == []
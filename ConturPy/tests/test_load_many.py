@@ -0,0 +1,36 @@
+import shutil
+import warnings
+from pathlib import Path
+import numpy as np
+import pytest
+from conturpy import ConturResult
+
+OUTPUT = Path(__file__).parent / "data" / "m4_output.txt"
+
+
+def test_mmap_transport_below_descriptor_limit(tmp_path):
+    resource = pytest.importorskip("resource")
+    paths = []
+    for idx in range(100):
+        paths.append(tmp_path / f"run{idx:03d}.txt")
+        shutil.copyfile(OUTPUT, paths[-1])
+
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (64, hard))
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            mapped = ConturResult.load_many(paths, workers=2, transport="mmap", scratch_dir=tmp_path)
+    finally:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (soft, hard))
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        result = ConturResult(OUTPUT)
+    assert len(mapped) == len(paths)
+    assert [x.filename for x in mapped] == [str(path) for path in paths]
+    for x in (mapped[0], mapped[-1]):
+        assert x.design_mach == result.design_mach
+        np.testing.assert_array_equal(x.coordinates, result.coordinates)
+    # only the inputs are left, the mapped files are removed
+    assert sorted(tmp_path.iterdir()) == paths
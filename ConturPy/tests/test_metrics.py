@@ -0,0 +1,65 @@
+import logging
+import shutil
+import stat
+import sys
+import warnings
+from pathlib import Path
+import pytest
+from conturpy import ConturApplication, ConturMetrics, ConturResult
+from conturpy.metrics import timed
+
+OUTPUT = Path(__file__).parent / "data" / "m4_output.txt"
+
+
+def _counts(metrics):
+    return {stage: values["count"] for stage, values in metrics.to_dict().items()}
+
+
+def test_failing_hook_is_logged(caplog):
+    def hook(stage, elapsed):
+        raise RuntimeError("exporter down")
+
+    with caplog.at_level(logging.ERROR, logger="conturpy.metrics"):
+        with ConturMetrics(hooks=[hook]) as metrics:
+            with timed("run"):
+                pass
+    assert _counts(metrics) == {"run": 1}
+    assert "exporter down" in caplog.text
+
+
+@pytest.mark.parametrize("transport", ["pickle", "mmap"])
+def test_worker_timings_are_merged(tmp_path, transport):
+    paths = []
+    for idx in range(8):
+        paths.append(tmp_path / f"run{idx}.txt")
+        shutil.copyfile(OUTPUT, paths[-1])
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        with ConturMetrics() as serial:
+            ConturResult.load_many(paths, workers=1)
+        with ConturMetrics() as parallel:
+            ConturResult.load_many(paths, workers=2, transport=transport, scratch_dir=tmp_path)
+    assert serial.stages
+    assert _counts(parallel) == _counts(serial)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="the stand-in executable is a shell script")
+def test_run_timings_from_process_pool(tmp_path):
+    # a stand-in for CONTUR that writes a recorded output
+    executable = tmp_path / "contur"
+    executable.write_text(f"#!/bin/sh\ncp {OUTPUT} output.txt\n")
+    executable.chmod(executable.stat().st_mode | stat.S_IEXEC)
+    files = []
+    for idx in range(4):
+        files.append(str(tmp_path / f"case{idx}.txt"))
+        with open(files[-1], 'w') as out_file:
+            out_file.write("  Case m4    0 \n")
+    application = ConturApplication(location=str(tmp_path), executable=str(executable), timeout=10)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        with ConturMetrics() as metrics:
+            results = application.batch_input_files(files, output_dir=str(tmp_path), workers=2, use_processes=True)
+    assert len(results) == len(files)
+    assert _counts(metrics)["run"] == len(files)
@@ -0,0 +1,79 @@
+import asyncio
+import os
+import stat
+import sys
+import time
+import pytest
+from conturpy import ConturApplication
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="the stand-in executable is a shell script")
+
+
+def _hanging_application(tmp_path, jobs=2, quick=0):
+    # a stand-in for CONTUR that fails right away on "quick" decks, records its pid and never finishes otherwise
+    pids = tmp_path / "pids"
+    executable = tmp_path / "contur"
+    executable.write_text(f"#!/bin/sh\ngrep -q quick input.txt && exit 0\necho $$ >> {pids}\nexec sleep 60\n")
+    executable.chmod(executable.stat().st_mode | stat.S_IEXEC)
+    files = []
+    for idx in range(quick + jobs):
+        files.append(str(tmp_path / f"case{idx}.txt"))
+        with open(files[-1], 'w') as out_file:
+            out_file.write("  quick\n" if idx < quick else "  Case m4    0 \n")
+    application = ConturApplication(location=str(tmp_path), executable=str(executable), timeout=60,
+                                    scratch_dir=str(tmp_path))
+    return application, files, pids
+
+
+async def _wait_for_pids(pids, count):
+    start = time.perf_counter()
+    while not pids.exists() or len(pids.read_text().split()) < count:
+        assert time.perf_counter() - start < 10, "the runs did not start"
+        await asyncio.sleep(.01)
+    return [int(pid) for pid in pids.read_text().split()]
+
+
+def _running(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    return True
+
+
+def test_cancelled_batch_leaves_no_process(tmp_path):
+    application, files, pids = _hanging_application(tmp_path)
+
+    async def consume():
+        async for _ in application.batch_input_files_async(files, output_dir=str(tmp_path), concurrency=2):
+            pass
+
+    async def main():
+        consumer = asyncio.ensure_future(consume())
+        running = await _wait_for_pids(pids, len(files))
+        consumer.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await consumer
+        return running
+
+    start = time.perf_counter()
+    running = asyncio.run(main())
+    assert time.perf_counter() - start < 30
+    assert not any(_running(pid) for pid in running)
+    assert not [path for path in tmp_path.iterdir() if path.name.startswith("contur_")]
+
+
+def test_abandoned_batch_leaves_no_process(tmp_path):
+    application, files, pids = _hanging_application(tmp_path, quick=1)
+
+    async def main():
+        batch = application.batch_input_files_async(files, output_dir=str(tmp_path), concurrency=3)
+        async for _ in batch:
+            running = await _wait_for_pids(pids, len(files) - 1)
+            break
+        await batch.aclose()
+        return running
+
+    running = asyncio.run(main())
+    assert not any(_running(pid) for pid in running)
+    assert not [path for path in tmp_path.iterdir() if path.name.startswith("contur_")]
@@ -0,0 +1,55 @@
+import os
+import warnings
+from pathlib import Path
+import numpy as np
+import pytest
+from conturpy import ConturResult
+
+OUTPUT = Path(__file__).parent / "data" / "m4_output.txt"
+
+
+def _result(filename=OUTPUT):
+    with warnings.catch_warnings():
+        # CONTUR's boundary layer rows carry an extra unformatted column
+        warnings.simplefilter("ignore")
+        return ConturResult(filename)
+
+
+def _assert_same(loaded, result):
+    assert loaded.title == result.title
+    assert loaded.nozzle_length == result.nozzle_length
+    assert loaded.design_mach == result.design_mach
+    assert len(loaded.sections) == len(result.sections)
+    np.testing.assert_array_equal(loaded.coordinates, result.coordinates)
+    for loaded_section, section in zip(loaded.sections, result.sections):
+        assert loaded_section.class_name == section.class_name
+        tables = section.tables if isinstance(section.tables, list) else [section.tables]
+        loaded_tables = loaded_section.tables if isinstance(loaded_section.tables, list) else [loaded_section.tables]
+        for loaded_table, table in zip(loaded_tables, tables):
+            np.testing.assert_array_equal(loaded_table.data, table.data)
+
+
+def test_path_round_trip(tmp_path):
+    result = _result(OUTPUT)
+    result.save(tmp_path / "run.npz")
+    loaded = ConturResult.load(tmp_path / "run.npz")
+    assert loaded.filename == os.fspath(OUTPUT)
+    _assert_same(loaded, result)
+
+
+def test_load_more_results_than_descriptor_limit(tmp_path):
+    resource = pytest.importorskip("resource")
+    result = _result()
+    result.save(tmp_path / "run.npz")
+
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (64, hard))
+    try:
+        loaded = [ConturResult.load(tmp_path / "run.npz") for _ in range(200)]
+        # descriptors are still available once all of them are loaded
+        with open(tmp_path / "run.npz", 'rb'):
+            pass
+    finally:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (soft, hard))
+    for x in (loaded[0], loaded[-1]):
+        _assert_same(x, result)
@@ -0,0 +1,29 @@
+import pickle
+import pytest
+from conturpy import ConturScheduler
+
+DECK = "  Case m4    0 \n   1.4  1716.563  0.  0. 0.0  0.  1.0 \n  8.  4.   0.  0.  0.  0.  0.  0. \n" \
+       "  21  25  -21  15  5 \n"
+
+
+def test_single_sample():
+    scheduler = ConturScheduler(min_samples=1, safety=2., min_timeout=0.)
+    assert scheduler.expected_runtime(DECK) is None
+    scheduler.record(DECK, 1.5)
+    assert scheduler.expected_runtime(DECK) == (1.5, 0., 1.5)
+    assert scheduler.timeout_for(DECK) == pytest.approx(3.)
+
+
+def test_no_samples_required():
+    scheduler = ConturScheduler(min_samples=0)
+    assert scheduler.timeout_for(DECK) == scheduler.initial_timeout
+
+
+def test_spread():
+    scheduler = ConturScheduler(min_samples=2, safety=1., spread=1., min_timeout=0.)
+    for runtime in (1., 3.):
+        scheduler.record(DECK, runtime)
+    mean, std, max_runtime = scheduler.expected_runtime(DECK)
+    assert (mean, max_runtime) == (2., 3.)
+    assert std == pytest.approx(2 ** .5)
+    assert pickle.loads(pickle.dumps(scheduler)).expected_runtime(DECK) == (mean, std, max_runtime)